@@ -149,6 +149,7 @@ async def _async_create_runtime(
     config_service.register_entry_data(dict(entry.data))
     if not await config_service.validate_config():
         raise ConfigEntryError("Lokale Integrationskonfiguration ist ungültig")
+    await config_service.async_prefetch_translations()
 
     mqtt_service = MQTTService(hass, config_service, entry.entry_id)
     parser_service = ParserService(hass, config_service)
@@ -9,7 +9,7 @@ import json
 import logging
 from pathlib import Path
 import re
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
@@ -17,6 +17,7 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from .api_client import DeviceCatalogClient, DeviceCatalogError, filter_selection_candidates
 from .const import CONFIG_FILE
 from .interfaces import ConfigServiceProtocol
+from .translation_helper import TranslationHelper
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,6 +33,7 @@ class ConfigService(ConfigServiceProtocol):
         self._catalog: Optional[List[Dict[str, Any]]] = None
         self._catalog_error: Optional[DeviceCatalogError] = None
         self._entry_device_metadata: Dict[str, Dict[str, Any]] = {}
+        self._translation_helper = TranslationHelper(hass)
     
     async def load_config(self) -> Dict[str, Any]:
         """Lädt die Konfiguration asynchron."""
@@ -390,17 +392,14 @@ class ConfigService(ConfigServiceProtocol):
         devices = await self.get_devices()
         return devices.get(device_type, [])
     
-    async def get_sensor_names(self) -> Dict[str, str]:
+    async def async_prefetch_translations(self) -> None:
+        """Lädt die Übersetzungen vorab, damit die Entities sie warm vorfinden."""
+        await self._translation_helper.async_prefetch()
+
+    async def get_sensor_names(self) -> Mapping[str, str]:
         """Gibt die Sensor-Namen-Übersetzungen zurück."""
         try:
-            # Nutze den TranslationHelper, um Übersetzungen zu laden
-            from .translation_helper import TranslationHelper
-
-            translation_helper = TranslationHelper(self.hass)
-            sensor_names = await translation_helper.get_sensor_names()
-
-            _LOGGER.debug("Sensor-Namen geladen: %s", sensor_names)
-            return sensor_names
+            return await self._translation_helper.get_sensor_names()
 
         except Exception as e:
             _LOGGER.warning(
@@ -408,18 +407,11 @@ class ConfigService(ConfigServiceProtocol):
             )
             return {}
     
-    async def get_device_categories(self) -> Dict[str, str]:
+    async def get_device_categories(self) -> Mapping[str, str]:
         """Gibt die Geräte-Kategorien-Übersetzungen zurück."""
         try:
-            # Verwende den TranslationHelper für die moderne HA 2025 API
-            from .translation_helper import TranslationHelper
-            
-            translation_helper = TranslationHelper(self.hass)
-            device_categories = await translation_helper.get_device_categories()
-            
-            _LOGGER.debug("Geräte-Kategorien geladen: %s", device_categories)
-            return device_categories
-            
+            return await self._translation_helper.get_device_categories()
+
         except Exception as e:
             _LOGGER.warning("Fehler beim Laden der Geräte-Kategorien-Übersetzungen: %s", e)
             return {}
@@ -465,34 +457,20 @@ class ConfigService(ConfigServiceProtocol):
         
         return device_class_mapping
     
-    async def get_ui_text(self) -> Dict[str, str]:
+    async def get_ui_text(self) -> Mapping[str, str]:
         """Gibt die UI-Texte zurück."""
         try:
-            # Verwende den TranslationHelper für die moderne HA 2025 API
-            from .translation_helper import TranslationHelper
-            
-            translation_helper = TranslationHelper(self.hass)
-            ui_text = await translation_helper.get_ui_text()
-            
-            _LOGGER.debug("UI-Texte geladen: %s", ui_text)
-            return ui_text
-            
+            return await self._translation_helper.get_ui_text()
+
         except Exception as e:
             _LOGGER.warning("Fehler beim Laden der UI-Texte: %s", e)
             return {}
     
-    async def get_error_messages(self) -> Dict[str, str]:
+    async def get_error_messages(self) -> Mapping[str, str]:
         """Gibt die Fehlermeldungen zurück."""
         try:
-            # Verwende den TranslationHelper für die moderne HA 2025 API
-            from .translation_helper import TranslationHelper
-            
-            translation_helper = TranslationHelper(self.hass)
-            error_messages = await translation_helper.get_error_messages()
-            
-            _LOGGER.debug("Fehlermeldungen geladen: %s", error_messages)
-            return error_messages
-            
+            return await self._translation_helper.get_error_messages()
+
         except Exception as e:
             _LOGGER.warning("Fehler beim Laden der Fehlermeldungen: %s", e)
             return {}
@@ -500,16 +478,13 @@ class ConfigService(ConfigServiceProtocol):
     async def debug_translations(self) -> Dict[str, Any]:
         """Debug-Methode um die Translation-Ladung zu überprüfen."""
         try:
-            from .translation_helper import TranslationHelper
-            
-            translation_helper = TranslationHelper(self.hass)
-            debug_info = await translation_helper.debug_translations()
+            debug_info = await self._translation_helper.debug_translations()
             
             # Zusätzliche Info: Verfügbare Sensor-Namen
             sensor_names = await self.get_sensor_names()
             debug_info["config_service_sensor_names"] = sensor_names
             
-            _LOGGER.info("ConfigService Translation Debug: %s", debug_info)
+            _LOGGER.debug("ConfigService Translation Debug: %s", list(debug_info))
             return debug_info
             
         except Exception as e:
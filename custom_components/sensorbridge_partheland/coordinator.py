@@ -440,10 +440,9 @@ class SensorBridgeCoordinator(DataUpdateCoordinator, CoordinatorProtocol):
             _LOGGER.debug("MQTT-Nachricht erfolgreich geparst: %s", parsed_data)
             
             # Sensordaten aktualisieren
-            device_id = parsed_data["device_id"]
-            sensor_data = parsed_data["sensor_data"]
-            
-            await self.update_sensor_data(device_id, sensor_data)
+            await self.update_sensor_data(
+                parsed_data.device_id, parsed_data.sensor_data
+            )
             
         except Exception as e:
             await self.error_handler.handle_error(e, f"Handle MQTT Message: {topic}")
@@ -6,7 +6,8 @@ HA 2025 Compliant mit Protocol-Klassen für Dependency Injection
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
-from typing import Any, Dict, Iterable, List, Optional, Protocol
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Protocol
 
 
 class ConfigServiceProtocol(Protocol):
@@ -50,19 +51,19 @@ class ConfigServiceProtocol(Protocol):
         """Validiert die Konfiguration."""
         ...
     
-    async def get_sensor_names(self) -> Dict[str, str]:
+    async def get_sensor_names(self) -> Mapping[str, str]:
         """Gibt die Sensor-Namen-Übersetzungen zurück."""
         ...
     
-    async def get_device_categories(self) -> Dict[str, str]:
+    async def get_device_categories(self) -> Mapping[str, str]:
         """Gibt die Geräte-Kategorien-Übersetzungen zurück."""
         ...
     
-    async def get_ui_text(self) -> Dict[str, str]:
+    async def get_ui_text(self) -> Mapping[str, str]:
         """Gibt die UI-Texte zurück."""
         ...
     
-    async def get_error_messages(self) -> Dict[str, str]:
+    async def get_error_messages(self) -> Mapping[str, str]:
         """Gibt die Fehlermeldungen zurück."""
         ...
 
@@ -103,10 +104,21 @@ class MQTTServiceProtocol(Protocol):
         ...
 
 
+@dataclass(slots=True)
+class SensorMessage:
+    """Ergebnis einer erfolgreich geparsten MQTT-Nachricht."""
+
+    device_id: str
+    device_type: str
+    topic: str
+    sensor_data: Dict[str, Any]
+    is_median: bool
+
+
 class ParserServiceProtocol(Protocol):
     """Protocol für Parser Service Interface."""
     
-    async def parse_message(self, topic: str, payload: Any) -> Optional[Dict[str, Any]]:
+    async def parse_message(self, topic: str, payload: Any) -> Optional[SensorMessage]:
         """Parst eine MQTT-Nachricht."""
         ...
     
@@ -114,7 +126,7 @@ class ParserServiceProtocol(Protocol):
         """Validiert eine MQTT-Nachricht."""
         ...
     
-    async def get_sensor_data(self, topic: str, payload: Any) -> Optional[Dict[str, Any]]:
+    async def get_sensor_data(self, topic: str, payload: Any) -> Optional[SensorMessage]:
         """Extrahiert Sensordaten aus einer Nachricht."""
         ...
 
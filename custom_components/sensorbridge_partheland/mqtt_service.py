@@ -9,6 +9,7 @@ import asyncio
 from collections import deque
 from collections.abc import Awaitable, Callable
 import logging
+import socket
 import ssl
 import threading
 import uuid
@@ -41,6 +42,8 @@ class MQTTService(MQTTServiceProtocol):
     ) -> None:
         """Initialisiert den MQTT Service."""
         self.hass = hass
+        # Event Loop für Paho-Thread-Callbacks einmalig binden
+        self._loop = hass.loop
         self.config_service = config_service
         self.entry_id = entry_id
         self.client: Optional[mqtt.Client] = None
@@ -182,6 +185,7 @@ class MQTTService(MQTTServiceProtocol):
             self.client.on_disconnect = self._on_disconnect
             self.client.on_message = self._on_message
             self.client.on_subscribe = self._on_subscribe
+            self.client.on_socket_open = self._on_socket_open
 
             # WebSocket-Verbindung konfigurieren
             if self._broker_url.startswith("wss://") and self._ssl_context:
@@ -496,7 +500,7 @@ class MQTTService(MQTTServiceProtocol):
             _LOGGER.info("MQTT-Verbindung erfolgreich hergestellt")
 
             # Thread-sicher: Event in Queue einreihen über Event Loop
-            self.hass.loop.call_soon_threadsafe(
+            self._loop.call_soon_threadsafe(
                 self._queue_event, "connect", None
             )
         else:
@@ -522,6 +526,15 @@ class MQTTService(MQTTServiceProtocol):
                     # Neue Client-ID generieren für nächsten Versuch
                     self._client_id = f"{CLIENT_ID_PREFIX}{uuid.uuid4().hex[:8]}"
     
+    def _on_socket_open(self, client: mqtt.Client, userdata: Any, sock: Any) -> None:
+        """Deaktiviert Nagle auf dem Broker-Socket für kleine Steuerpakete."""
+        # Bei WebSockets kapselt Paho den TCP-Socket in einem Wrapper
+        raw_sock = getattr(sock, "_socket", sock)
+        try:
+            raw_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (AttributeError, OSError) as e:
+            _LOGGER.debug("TCP_NODELAY konnte nicht gesetzt werden: %s", e)
+    
     def _on_disconnect(self, client: mqtt.Client, userdata: Any, flags, reason_code, properties=None) -> None:
         """Callback für MQTT-Trennung (API Version 2)."""
         if client is not self.client:
@@ -530,7 +543,7 @@ class MQTTService(MQTTServiceProtocol):
             return
         self._connected = False
         self._active_subscriptions.clear()
-        self.hass.loop.call_soon_threadsafe(
+        self._loop.call_soon_threadsafe(
             self._fail_pending_subscriptions
         )
         # Freundlichere Fehlermeldung für gängige Gründe
@@ -550,7 +563,7 @@ class MQTTService(MQTTServiceProtocol):
         
         # Thread-sicher: Event in Queue einreihen über Event Loop
         if not self._stopping:
-            self.hass.loop.call_soon_threadsafe(
+            self._loop.call_soon_threadsafe(
                 self._queue_event, "disconnect", reason_code
             )
 
@@ -573,7 +586,7 @@ class MQTTService(MQTTServiceProtocol):
             if mid not in self._subscription_expected_mids:
                 return
             self._subscription_results[mid] = accepted
-        self.hass.loop.call_soon_threadsafe(
+        self._loop.call_soon_threadsafe(
             self._handle_subscription_result,
             mid,
         )
@@ -643,7 +656,7 @@ class MQTTService(MQTTServiceProtocol):
                 topic,
             )
         if should_wake:
-            self.hass.loop.call_soon_threadsafe(self._message_ready.set)
+            self._loop.call_soon_threadsafe(self._message_ready.set)
 
     async def _resubscribe_all(self) -> bool:
         """Abonniert alle zuvor registrierten Topics nach einem Reconnect erneut."""
@@ -5,17 +5,36 @@ HA 2025 Compliant - Reines Message Parsing
 
 from __future__ import annotations
 
-import json
 import logging
-import re
+import sys
 from typing import Any, Dict, Optional
 
 from homeassistant.core import HomeAssistant
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
-from .interfaces import ParserServiceProtocol, ConfigServiceProtocol
+from .interfaces import ParserServiceProtocol, ConfigServiceProtocol, SensorMessage
 
 _LOGGER = logging.getLogger(__name__)
 
+# Topic-Präfixe der gültigen Topics, jeweils gefolgt von genau einem Segment
+_SENSEBOX_MEDIAN_PREFIX = "senseBox:home/median/"  # senseBox:home/median/Location
+_SENSEBOX_PREFIX = "senseBox:home/"  # senseBox:home/DeviceID
+_SPECIALIZED_PREFIX = "sensoren/"  # sensoren/DeviceID
+
+# Topic-Arten aus _classify_topic
+_TOPIC_SENSEBOX = 0
+_TOPIC_SPECIALIZED = 1
+_TOPIC_MEDIAN = 2
+
+# Exakte Payload-Typen, die json_loads direkt verarbeitet (paho liefert bytes)
+_PAYLOAD_TYPES = (bytes, str, bytearray, memoryview)
+
+# Exakte Typen numerischer Sensorwerte (bool wird bewusst nicht übernommen)
+_NUMERIC_TYPES = (int, float)
+
+# Je Gerät vorberechnet: (MQTT-Rohfeld, Sensorname, Umrechnungsfaktor oder None)
+_ExtractionPlan = tuple[tuple[str, str, Optional[float]], ...]
+
 
 class ParserService(ParserServiceProtocol):
     """HA 2025 Parser Service für reines Message Parsing."""
@@ -25,12 +44,24 @@ class ParserService(ParserServiceProtocol):
         self.hass = hass
         self.config_service = config_service
         self._parsing_config: Optional[Dict[str, Any]] = None
-        self._field_mapping: Optional[Dict[str, Any]] = None
+        self._unit_conversions: Dict[str, Any] = {}
+        # Aus der Parsing-Konfiguration abgeleitete Werte (siehe _ensure_parsing_config)
+        self._sensebox_data_path = "fields"
+        self._specialized_data_path = "fields"
+        self._ignore_rssi_only = True
+        # Konfigurierte Sensoren je Gerät bzw. Median (Schlüssel: Topic-ID)
+        self._device_sensor_index: Dict[str, frozenset[str]] = {}
+        self._median_sensor_index: Optional[Dict[str, frozenset[str]]] = None
+        # Standortname bzw. Topic-Segment -> konfigurierte Median-ID
+        self._median_location_to_id: Dict[str, str] = {}
+        # Extraktionsplan je Gerät bzw. Median (siehe _build_extraction_plan)
+        self._device_extraction_plans: Dict[str, _ExtractionPlan] = {}
     
-    async def parse_message(self, topic: str, payload: Any) -> Optional[Dict[str, Any]]:
+    async def parse_message(self, topic: str, payload: Any) -> Optional[SensorMessage]:
         """Parst eine MQTT-Nachricht."""
         try:
-            if not self._is_valid_topic(topic):
+            classified = self._classify_topic(topic)
+            if classified is None:
                 _LOGGER.debug("Ungültiges Topic-Pattern: %s", topic)
                 return None
 
@@ -38,7 +69,10 @@ class ParserService(ParserServiceProtocol):
             if data is None:
                 return None
 
-            sensor_data = await self._get_sensor_data(topic, data)
+            topic_kind, device_id = classified
+            sensor_data = await self._get_sensor_data(
+                topic, data, topic_kind, device_id
+            )
             if not sensor_data:
                 return None
             
@@ -56,149 +90,129 @@ class ParserService(ParserServiceProtocol):
             return False
         return self._decode_payload(topic, payload) is not None
     
-    async def get_sensor_data(self, topic: str, payload: Any) -> Optional[Dict[str, Any]]:
+    async def get_sensor_data(self, topic: str, payload: Any) -> Optional[SensorMessage]:
         """Extrahiert Sensordaten aus einer Nachricht."""
-        data = self._decode_payload(topic, payload)
-        if data is None:
-            return None
-        return await self._get_sensor_data(topic, data)
+        # Gleicher einmaliger Durchlauf wie parse_message
+        return await self.parse_message(topic, payload)
 
     def _decode_payload(
         self, topic: str, payload: Any
     ) -> Optional[Dict[str, Any]]:
         """Dekodiert und parst eine MQTT-Nutzlast genau einmal."""
-        try:
-            if not payload:
-                _LOGGER.debug("Leere Payload für Topic %s", topic)
-                return None
-            if isinstance(payload, bytes):
-                try:
-                    payload_str = payload.decode("utf-8")
-                except UnicodeDecodeError:
-                    _LOGGER.debug("Ungültige UTF-8 Payload für Topic %s", topic)
-                    return None
-            elif isinstance(payload, str):
-                payload_str = payload
-            else:
-                _LOGGER.debug(
-                    "Ungültiger Payload-Typ für Topic %s: %s",
-                    topic,
-                    type(payload),
-                )
-                return None
-
-            data = json.loads(payload_str)
-            if not isinstance(data, dict):
-                _LOGGER.debug("JSON-Objekt für Topic %s erwartet", topic)
-                return None
-            return data
-        except json.JSONDecodeError:
-            _LOGGER.debug("Ungültiges JSON für Topic %s", topic)
+        if not payload:
+            _LOGGER.debug("Leere Payload für Topic %s", topic)
             return None
-        except Exception as e:
-            _LOGGER.error("Fehler beim Dekodieren der Sensordaten: %s", e)
+        # Bytes gehen direkt an den Parser, der UTF-8 intern dekodiert
+        if type(payload) not in _PAYLOAD_TYPES:
+            _LOGGER.debug(
+                "Ungültiger Payload-Typ für Topic %s: %s",
+                topic,
+                type(payload),
+            )
             return None
 
-    async def _get_sensor_data(
-        self, topic: str, data: Dict[str, Any]
-    ) -> Optional[Dict[str, Any]]:
-        """Extrahiert Sensordaten aus einem bereits geparsten JSON-Objekt."""
         try:
-            # Parsing-Konfiguration laden
-            if not self._parsing_config:
-                self._parsing_config = await self.config_service.get_parsing_config()
-            
-            # Topic-Typ bestimmen
-            topic_type = self._get_topic_type(topic)
-            
-            # Je nach Topic-Typ parsen
-            if topic_type == "sensebox":
-                return await self._parse_sensebox_message(topic, data)
-            elif topic_type == "specialized_sensors":
-                return await self._parse_specialized_message(topic, data)
-            else:
-                _LOGGER.debug("Unbekannter Topic-Typ: %s", topic_type)
-                return None
-            
-        except Exception as e:
-            _LOGGER.error("Fehler beim Extrahieren der Sensordaten: %s", e)
+            data = json_loads(payload)
+        except UnicodeDecodeError:
+            _LOGGER.debug("Ungültige UTF-8 Payload für Topic %s", topic)
             return None
-    
-    async def _parse_sensebox_message(self, topic: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Parst senseBox-Nachrichten."""
-        try:
-            # Device-ID aus Topic extrahieren
-            device_id = self._extract_device_id_from_topic(topic)
-            if not device_id:
-                return None
+        except JSON_DECODE_EXCEPTIONS:
+            _LOGGER.debug("Ungültiges JSON für Topic %s", topic)
+            return None
+        if not isinstance(data, dict):
+            _LOGGER.debug("JSON-Objekt für Topic %s erwartet", topic)
+            return None
+        return data
 
-            # Median-Erkennung
-            median_detection = self._parsing_config.get("sensebox", {}).get(
-                "median_detection", {}
-            )
-            is_median = self._is_median_topic(topic, median_detection)
+    async def _get_sensor_data(
+        self,
+        topic: str,
+        data: Dict[str, Any],
+        topic_kind: int,
+        device_id: str,
+    ) -> Optional[SensorMessage]:
+        """Extrahiert Sensordaten aus einem bereits geparsten JSON-Objekt.
 
-            # Bei Median-Topics wird als "device_id" der Standortname extrahiert
-            # (z. B. senseBox:home/median/Naunhof -> "Naunhof"). Für die
-            # interne Zuordnung und Entity-Matches mappen wir auf die
-            # konfigurierte Median-ID (z. B. "median_Naunhof"), sofern vorhanden.
-            if is_median:
-                device_id = await self._map_median_location_to_id(device_id)
+        Topic-Art und Device-ID stammen aus _classify_topic. Asynchron
+        geladen werden nur die Konfiguration und die Feldzuordnung eines noch
+        unbekannten Geräts; das eigentliche Parsen läuft synchron. Fehler
+        werden an der Grenze in parse_message behandelt.
+        """
+        # Parsing-Konfiguration laden
+        if self._parsing_config is None:
+            await self._ensure_parsing_config()
+        
+        # Bei Median-Topics wird als "device_id" der Standortname extrahiert
+        # (z. B. senseBox:home/median/Naunhof -> "Naunhof"). Für die
+        # interne Zuordnung und Entity-Matches mappen wir auf die
+        # konfigurierte Median-ID (z. B. "median_Naunhof"), sofern vorhanden.
+        is_median = topic_kind == _TOPIC_MEDIAN
+        if is_median:
+            device_id = self._map_median_location_to_id(device_id)
 
-            # Fields-Pfad bestimmen - für Median-Topics direkt im Root-Level
-            if is_median:
-                fields = data  # Median-Topics haben keine fields-Struktur
-            else:
-                fields_path = self._parsing_config.get("sensebox", {}).get(
-                    "data_path", "fields"
-                )
-                fields = data.get(fields_path, {})
-            
-            if not fields:
-                _LOGGER.debug("Keine Fields in senseBox-Nachricht gefunden")
-                return None
-            
-            # Konfigurierte Sensoren für dieses Gerät laden
-            configured_sensors = await self._get_configured_sensors_for_device(
-                device_id, is_median, device_type="sensebox"
+        extraction_plan = self._device_extraction_plans.get(device_id)
+        if extraction_plan is None:
+            extraction_plan = await self._load_extraction_plan(
+                device_id, is_median
             )
-            if not configured_sensors:
+            if extraction_plan is None:
                 return None
-            
-            # Median-Felder bleiben unverändert. Gerätefelder werden auf die
-            # kanonischen Feldnamen des API-Katalogs abgebildet.
-            sensor_data = {}
-            for field_name, field_value in fields.items():
-                if not isinstance(field_value, (int, float)):
-                    continue
-                sensor_name = (
-                    field_name
-                    if is_median
-                    else await self.config_service.get_canonical_sensor_name(field_name)
-                )
-                if sensor_name not in configured_sensors:
-                    continue
-                converted_value = await self._apply_unit_conversion(
-                    sensor_name, field_value
-                )
-                sensor_data[sensor_name] = converted_value
-            
-            if not sensor_data:
-                return None
-            
-            return {
-                "device_id": device_id,
-                "device_type": "sensebox",
-                "topic": topic,
-                "sensor_data": sensor_data,
-                "is_median": is_median
-            }
-            
-        except Exception as e:
-            _LOGGER.error("Fehler beim Parsen der senseBox-Nachricht: %s", e)
+        
+        # Je nach Topic-Art parsen
+        if topic_kind == _TOPIC_SPECIALIZED:
+            return self._parse_specialized_message(
+                topic, data, device_id, extraction_plan
+            )
+        return self._parse_sensebox_message(
+            topic, data, device_id, extraction_plan, is_median
+        )
+    
+    async def _ensure_parsing_config(self) -> None:
+        """Lädt die Parsing-Konfiguration und legt benötigte Werte einmalig ab."""
+        if self._parsing_config is not None:
+            return
+        parsing_config = await self.config_service.get_parsing_config()
+        sensebox = parsing_config.get("sensebox", {})
+        specialized = parsing_config.get("specialized_sensors", {})
+        self._sensebox_data_path = sensebox.get("data_path", "fields")
+        self._specialized_data_path = specialized.get("data_path", "fields")
+        self._ignore_rssi_only = specialized.get("ignore_rssi_only", True)
+        config = await self.config_service.load_config()
+        self._unit_conversions = config.get("field_mapping", {}).get(
+            "unit_conversions", {}
+        )
+        await self._ensure_median_index()
+        self._parsing_config = parsing_config
+
+    def _parse_sensebox_message(
+        self,
+        topic: str,
+        data: Dict[str, Any],
+        device_id: str,
+        extraction_plan: _ExtractionPlan,
+        is_median: bool,
+    ) -> Optional[SensorMessage]:
+        """Parst senseBox-Nachrichten."""
+        # Fields-Pfad bestimmen - für Median-Topics direkt im Root-Level
+        if is_median:
+            fields = data  # Median-Topics haben keine fields-Struktur
+        else:
+            fields = data.get(self._sensebox_data_path, {})
+        
+        if not fields or not isinstance(fields, dict):
+            _LOGGER.debug("Keine Fields in senseBox-Nachricht gefunden")
             return None
+        
+        # Median-Felder bleiben unverändert. Gerätefelder werden auf die
+        # kanonischen Feldnamen des API-Katalogs abgebildet.
+        sensor_data = self._extract_sensor_data(fields, extraction_plan)
+        
+        if not sensor_data:
+            return None
+        
+        return SensorMessage(device_id, "sensebox", topic, sensor_data, is_median)
     
-    async def _get_configured_sensors_for_device(self, device_id: str, is_median: bool, device_type: Optional[str] = None) -> Optional[list[str]]:
+    async def _get_configured_sensors_for_device(self, device_id: str, is_median: bool, device_type: Optional[str] = None) -> Optional[frozenset[str]]:
         """Lädt die konfigurierten Sensoren für ein Gerät.
 
         device_id: Bei normalen Topics ist das die Geräte-ID aus dem Topic.
@@ -208,201 +222,222 @@ class ParserService(ParserServiceProtocol):
         """
         try:
             if is_median:
-                # Median-Entities über den ConfigService beziehen (HA 2025 konforme Struktur)
-                median_entities = await self.config_service.get_median_entities()
-
-                # Unterstütze sowohl Standortnamen (z. B. "Naunhof") als auch
-                # Median-IDs (z. B. "median_Naunhof").
-                for median_entity in median_entities:
-                    if not isinstance(median_entity, dict):
-                        continue
-                    location = median_entity.get("location")
-                    topic_pattern = median_entity.get("topic_pattern", "")
-                    median_id = median_entity.get("id")
-
-                    # Direkter ID-Match
-                    if median_id == device_id:
-                        return median_entity.get("sensors", [])
-
-                    # Match nach Location (senseBox:home/median/<Location>)
-                    if location == device_id:
-                        return median_entity.get("sensors", [])
-
-                    # Wenn device_id wie "median_<Location>" aussieht, Location extrahieren
-                    if isinstance(device_id, str) and device_id.startswith("median_"):
-                        loc_from_id = device_id[len("median_"):]
-                        if location == loc_from_id:
-                            return median_entity.get("sensors", [])
-
-                    # Fallback: Ende des Topic-Patterns muss mit /<device_id> übereinstimmen
-                    if topic_pattern.endswith(f"/{device_id}"):
-                        return median_entity.get("sensors", [])
-
-                return None
+                median_sensor_index = await self._ensure_median_index()
+                return median_sensor_index.get(device_id)
 
-            device = await self.config_service.get_device_by_id(device_id)
-            if not device:
-                return None
-            return device.get("sensors", [])
+            sensors = self._device_sensor_index.get(device_id)
+            if sensors is None:
+                device = await self.config_service.get_device_by_id(device_id)
+                if not device:
+                    return None
+                sensors = frozenset(device.get("sensors", []))
+                self._device_sensor_index[device_id] = sensors
+            return sensors
 
         except Exception as e:
             _LOGGER.error("Fehler beim Laden der konfigurierten Sensoren für Gerät %s: %s", device_id, e)
             return None
-    
-    async def _parse_specialized_message(self, topic: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Parst spezialisierte Sensor-Nachrichten."""
-        try:
-            # Device-ID aus Topic extrahieren
-            device_id = self._extract_device_id_from_topic(topic)
-            if not device_id:
-                return None
-            
-            # Fields-Pfad bestimmen – ausschließlich "fields" (bzw. konfigurierbarer Pfad)
-            fields_path = self._parsing_config.get("specialized_sensors", {}).get("data_path", "fields")
-            fields = data.get(fields_path, {})
-            
-            if not fields:
-                _LOGGER.debug("Keine Fields in spezialisierter Nachricht gefunden")
-                return None
-            
-            # RSSI-Only-Filter
-            ignore_rssi_only = self._parsing_config.get("specialized_sensors", {}).get("ignore_rssi_only", True)
-            if ignore_rssi_only and self._is_rssi_only_message(fields):
-                _LOGGER.debug("RSSI-Only-Nachricht ignoriert")
-                return None
-            
-            # Konfigurierte Sensoren für dieses Gerät laden
-            configured_sensors = await self._get_configured_sensors_for_device(
-                device_id, False, device_type="specialized"
+
+    async def _ensure_median_index(self) -> Dict[str, frozenset[str]]:
+        """Baut die Median-Indizes beim ersten Zugriff auf."""
+        if self._median_sensor_index is None:
+            # Median-Entities über den ConfigService beziehen (HA 2025 konforme Struktur)
+            (
+                self._median_sensor_index,
+                self._median_location_to_id,
+            ) = self._build_median_index(
+                await self.config_service.get_median_entities()
             )
-            if not configured_sensors:
-                return None
-            
-            # MQTT-Rohfelder auf API-Feldnamen normalisieren.
-            sensor_data = {}
-            for field_name, field_value in fields.items():
-                if not isinstance(field_value, (int, float)):
-                    continue
-                sensor_name = await self.config_service.get_canonical_sensor_name(
-                    field_name
-                )
-                if sensor_name not in configured_sensors:
-                    continue
-                converted_value = await self._apply_unit_conversion(
-                    sensor_name, field_value
+        return self._median_sensor_index
+
+    @staticmethod
+    def _build_median_index(
+        median_entities: list[Dict[str, Any]],
+    ) -> tuple[Dict[str, frozenset[str]], Dict[str, str]]:
+        """Indexiert Sensoren und IDs aller Median-Entities nach ihren Topic-IDs.
+
+        Unterstützt sowohl Standortnamen (z. B. "Naunhof") als auch
+        Median-IDs (z. B. "median_Naunhof") sowie das letzte Segment des
+        Topic-Patterns.
+        """
+        sensor_index: Dict[str, frozenset[str]] = {}
+        id_index: Dict[str, str] = {}
+        for median_entity in median_entities:
+            if not isinstance(median_entity, dict):
+                continue
+            sensors = frozenset(median_entity.get("sensors", []))
+            median_id = median_entity.get("id")
+            location = median_entity.get("location")
+            topic_pattern = median_entity.get("topic_pattern", "")
+            topic_suffix = (
+                topic_pattern[topic_pattern.rfind("/") + 1:]
+                if "/" in topic_pattern
+                else None
+            )
+            keys = [median_id, location]
+            if location:
+                keys.append(f"median_{location}")
+            keys.append(topic_suffix)
+            for key in keys:
+                if key:
+                    sensor_index.setdefault(key, sensors)
+            if median_id:
+                for key in (median_id, location, topic_suffix):
+                    if key:
+                        id_index.setdefault(key, median_id)
+        return sensor_index, id_index
+    
+    async def _load_extraction_plan(
+        self, device_id: str, is_median: bool
+    ) -> Optional[_ExtractionPlan]:
+        """Ordnet die MQTT-Rohfelder eines Geräts seinen konfigurierten Sensoren zu.
+
+        Neben dem kanonischen Namen werden frühere Feldnamen berücksichtigt,
+        sofern sie per Alias auf einen konfigurierten Sensor zeigen.
+        """
+        configured_sensors = await self._get_configured_sensors_for_device(
+            device_id, is_median
+        )
+        if not configured_sensors:
+            return None
+
+        if is_median:
+            field_map = {sensor_name: sensor_name for sensor_name in configured_sensors}
+        else:
+            field_map = {}
+            for sensor_name in configured_sensors:
+                candidates = [
+                    sensor_name,
+                    *await self.config_service.get_legacy_sensor_names(sensor_name),
+                ]
+                for field_name in candidates:
+                    canonical_name = await self.config_service.get_canonical_sensor_name(
+                        field_name
+                    )
+                    if canonical_name == sensor_name:
+                        field_map[field_name] = sensor_name
+        extraction_plan = self._build_extraction_plan(field_map)
+        self._device_extraction_plans[device_id] = extraction_plan
+        return extraction_plan
+
+    def _build_extraction_plan(self, field_map: Dict[str, str]) -> _ExtractionPlan:
+        """Legt Feldzuordnung und Einheitenkonvertierung je Feld einmalig fest."""
+        extraction_plan = []
+        for field_name, sensor_name in field_map.items():
+            conversion_factor = None
+            conversion_config = self._unit_conversions.get(sensor_name)
+            if isinstance(conversion_config, dict):
+                conversion_factor = conversion_config.get("conversion_factor", 1.0)
+                if type(conversion_factor) not in _NUMERIC_TYPES:
+                    _LOGGER.error(
+                        "Ungültiger Umrechnungsfaktor für %s: %s",
+                        sensor_name,
+                        conversion_factor,
+                    )
+                    conversion_factor = None
+                _LOGGER.debug(
+                    "Einheitenkonvertierung für %s: %s -> %s (Faktor: %s)",
+                    sensor_name,
+                    conversion_config.get("from_unit", ""),
+                    conversion_config.get("to_unit", ""),
+                    conversion_factor,
                 )
-                sensor_data[sensor_name] = converted_value
-            
-            if not sensor_data:
-                return None
-            
-            return {
-                "device_id": device_id,
-                "device_type": "specialized",
-                "topic": topic,
-                "sensor_data": sensor_data,
-                "is_median": False
-            }
-            
-        except Exception as e:
-            _LOGGER.error("Fehler beim Parsen der spezialisierten Nachricht: %s", e)
+            extraction_plan.append((field_name, sensor_name, conversion_factor))
+        return tuple(extraction_plan)
+
+    def _extract_sensor_data(
+        self, fields: Dict[str, Any], extraction_plan: _ExtractionPlan
+    ) -> Optional[Dict[str, Any]]:
+        """Übernimmt die numerischen Werte aller konfigurierten Felder.
+
+        Gibt None zurück, wenn kein konfiguriertes Feld einen Wert liefert.
+        """
+        # Erst beim ersten Treffer anlegen; verworfene Nachrichten allozieren nichts
+        sensor_data = None
+        # Über die (wenigen) konfigurierten Felder iterieren, nicht über die Nachricht
+        for field_name, sensor_name, conversion_factor in extraction_plan:
+            field_value = fields.get(field_name)
+            if type(field_value) not in _NUMERIC_TYPES:
+                continue
+            if conversion_factor is not None:
+                field_value = field_value * conversion_factor
+            if sensor_data is None:
+                sensor_data = {}
+            sensor_data[sensor_name] = field_value
+        return sensor_data
+
+    def _parse_specialized_message(
+        self,
+        topic: str,
+        data: Dict[str, Any],
+        device_id: str,
+        extraction_plan: _ExtractionPlan,
+    ) -> Optional[SensorMessage]:
+        """Parst spezialisierte Sensor-Nachrichten."""
+        # Fields-Pfad bestimmen – ausschließlich "fields" (bzw. konfigurierbarer Pfad)
+        fields = data.get(self._specialized_data_path, {})
+        
+        if not fields or not isinstance(fields, dict):
+            _LOGGER.debug("Keine Fields in spezialisierter Nachricht gefunden")
             return None
-    
-    def _is_valid_topic(self, topic: str) -> bool:
-        """Prüft ob das Topic einem gültigen Pattern entspricht."""
-        valid_patterns = [
-            r"^senseBox:home/[^/]+$",  # senseBox:home/DeviceID
-            r"^senseBox:home/median/[^/]+$",  # senseBox:home/median/Location
-            r"^sensoren/[^/]+$",  # sensoren/DeviceID
-        ]
         
-        for pattern in valid_patterns:
-            if re.match(pattern, topic):
-                return True
+        # RSSI-Only-Filter
+        if self._ignore_rssi_only and self._is_rssi_only_message(fields):
+            _LOGGER.debug("RSSI-Only-Nachricht ignoriert")
+            return None
         
-        return False
-    
-    def _get_topic_type(self, topic: str) -> str:
-        """Bestimmt den Topic-Typ."""
-        if topic.startswith("senseBox:home"):
-            return "sensebox"
-        elif topic.startswith("sensoren"):
-            return "specialized_sensors"
-        else:
-            return "unknown"
-    
-    def _extract_device_id_from_topic(self, topic: str) -> Optional[str]:
-        """Extrahiert die Device-ID aus dem Topic."""
-        # senseBox:home/DeviceID bzw. senseBox:home/median/Location
-        if topic.startswith("senseBox:home/"):
-            return topic.split("/")[-1]
+        # MQTT-Rohfelder auf API-Feldnamen normalisieren.
+        sensor_data = self._extract_sensor_data(fields, extraction_plan)
         
-        # sensoren/DeviceID -> DeviceID
-        elif topic.startswith("sensoren/"):
-            return topic.split("/")[-1]
+        if not sensor_data:
+            return None
         
-        return None
+        return SensorMessage(device_id, "specialized", topic, sensor_data, False)
     
-    def _is_median_topic(self, topic: str, median_detection: Dict[str, Any]) -> bool:
-        """Prüft ob es sich um ein Median-Topic handelt."""
-        topic_pattern = median_detection.get("topic_pattern", "senseBox:home/median")
-        return topic.startswith(topic_pattern)
+    def _is_valid_topic(self, topic: str) -> bool:
+        """Prüft ob das Topic einem gültigen Pattern entspricht."""
+        return self._classify_topic(topic) is not None
+
+    def _classify_topic(self, topic: str) -> Optional[tuple[int, str]]:
+        """Bestimmt Topic-Art und Device-ID in einem Durchlauf.
+
+        Gibt None zurück, wenn das Topic keinem gültigen Pattern entspricht.
+        Bei Median-Topics ist die Device-ID der Standortname.
+        """
+        # Reine String-Vergleiche statt Regex, häufigste Topics zuerst
+        if topic.startswith(_SENSEBOX_PREFIX):
+            if topic.startswith(_SENSEBOX_MEDIAN_PREFIX):
+                topic_kind = _TOPIC_MEDIAN
+                tail = topic[len(_SENSEBOX_MEDIAN_PREFIX):]
+            else:
+                topic_kind = _TOPIC_SENSEBOX
+                tail = topic[len(_SENSEBOX_PREFIX):]
+        elif topic.startswith(_SPECIALIZED_PREFIX):
+            topic_kind = _TOPIC_SPECIALIZED
+            tail = topic[len(_SPECIALIZED_PREFIX):]
+        else:
+            return None
+        if not tail or "/" in tail:
+            return None
+        # Interniert, da die IDs als Schlüssel in Index und
+        # Coordinator-Daten wiederkehren
+        return topic_kind, sys.intern(tail)
 
-    async def _map_median_location_to_id(self, location_or_id: str) -> str:
+    def _map_median_location_to_id(self, location_or_id: str) -> str:
         """Mappt einen Median-Standortnamen auf die konfigurierte Median-ID.
 
         Falls bereits eine Median-ID übergeben wurde oder keine Konfiguration
         gefunden wird, wird der Eingabewert zurückgegeben.
         """
-        try:
-            median_entities = await self.config_service.get_median_entities()
-
-            for entity in median_entities:
-                if not isinstance(entity, dict):
-                    continue
-                if entity.get("id") == location_or_id or entity.get("location") == location_or_id:
-                    return entity.get("id", location_or_id)
-        except Exception:
-            pass
-        return location_or_id
+        return self._median_location_to_id.get(location_or_id, location_or_id)
     
     def _is_rssi_only_message(self, fields: Dict[str, Any]) -> bool:
         """Prüft ob es sich um eine RSSI-Only-Nachricht handelt."""
-        # Nur RSSI-Felder vorhanden
-        rssi_fields = [k for k in fields.keys() if 'rssi' in k.lower()]
-        non_rssi_fields = [k for k in fields.keys() if 'rssi' not in k.lower()]
-        
-        return len(rssi_fields) > 0 and len(non_rssi_fields) == 0
-    
-    async def _apply_unit_conversion(self, field_name: str, field_value: float) -> float:
-        """Wendet Einheitenkonvertierung auf einen Feldwert an, falls konfiguriert."""
-        try:
-            # Hauptkonfiguration laden
-            config = await self.config_service.load_config()
-            
-            # Einheitenkonvertierungen aus der Konfiguration laden
-            unit_conversions = config.get("field_mapping", {}).get("unit_conversions", {})
-            
-            # Prüfen ob für dieses Feld eine Konvertierung konfiguriert ist
-            if field_name in unit_conversions:
-                conversion_config = unit_conversions[field_name]
-                conversion_factor = conversion_config.get("conversion_factor", 1.0)
-                from_unit = conversion_config.get("from_unit", "")
-                to_unit = conversion_config.get("to_unit", "")
-                
-                # Konvertierung anwenden
-                converted_value = field_value * conversion_factor
-                
-                _LOGGER.debug(
-                    "Einheitenkonvertierung für %s: %.2f %s -> %.2f %s (Faktor: %.3f)",
-                    field_name, field_value, from_unit, converted_value, to_unit, conversion_factor
-                )
-                
-                return converted_value
-            
-            # Keine Konvertierung konfiguriert, Originalwert zurückgeben
-            return field_value
-            
-        except Exception as e:
-            _LOGGER.error("Fehler bei der Einheitenkonvertierung für %s: %s", field_name, e)
-            return field_value
+        # Nur RSSI-Felder vorhanden; bricht beim ersten anderen Feld ab
+        has_rssi = False
+        for key in fields:
+            if "rssi" in key or "RSSI" in key or "rssi" in key.lower():
+                has_rssi = True
+            else:
+                return False
+        return has_rssi
@@ -5,22 +5,28 @@ HA 2025 Compliant - Sensor-Entity-Implementierung
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import sys
 import time
-from typing import Any, Dict, Optional, override
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional, override
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorStateClass,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import slugify
 
 from .const import (
@@ -36,6 +42,147 @@ from .runtime import SensorBridgeConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
+# Gemeinsamer leerer Gerätedatensatz für Lesezugriffe in native_value
+_EMPTY_DEVICE_DATA: Dict[str, Any] = {}
+
+# Icons der Meta-Entities je (kleingeschriebenem) Gerätetyp
+_META_ENTITY_ICONS = {
+    "sensebox": "mdi:memory",
+    "median": "mdi:chart-box-outline",
+    "waterlevel": "mdi:waves",
+    "temperature": "mdi:thermometer",
+}
+
+# Reihenfolge der Temperatursensoren; nicht gelistete Sensoren folgen danach
+_TEMPERATURE_SENSOR_PRIORITY = {
+    name: index
+    for index, name in enumerate(
+        ("LuftTemp", "TempC1", "TempC2", "WasserTemp", "WasserTemp_1", "WasserTemp_2")
+    )
+}
+
+
+def _build_device_info(
+    device_id: str, device_name: str, configuration_url: Optional[str] = None
+) -> DeviceInfo:
+    """Erstellt die DeviceInfo eines Geräts (ohne via_device)."""
+    device_info = DeviceInfo(
+        identifiers=frozenset({(DOMAIN, device_id)}),
+        name=device_name,
+        manufacturer=MANUFACTURER,
+        model=device_id,
+    )
+    if configuration_url:
+        device_info["configuration_url"] = configuration_url
+    return device_info
+
+
+def _format_seconds(total_seconds: int) -> str:
+    return f"vor {total_seconds} s"
+
+
+def _format_minutes(total_seconds: int) -> str:
+    return f"vor {total_seconds // 60} min"
+
+
+def _format_hours(total_seconds: int) -> str:
+    total_minutes = total_seconds // 60
+    rem_min = total_minutes % 60
+    if rem_min:
+        return f"vor {total_minutes // 60} Std. {rem_min} min"
+    return f"vor {total_minutes // 60} Std."
+
+
+def _format_days(total_seconds: int) -> str:
+    total_hours = total_seconds // 3600
+    rem_hours = total_hours % 24
+    if rem_hours:
+        return f"vor {total_hours // 24} Tg. {rem_hours} Std."
+    return f"vor {total_hours // 24} Tg."
+
+
+# Obergrenzen (Sekunden, exklusiv) der Dauerformate; bisect wählt den Formatter
+_DURATION_THRESHOLDS = (60, 3600, 86400)
+_DURATION_FORMATTERS = (_format_seconds, _format_minutes, _format_hours, _format_days)
+
+
+@lru_cache(maxsize=256)
+def _sensor_object_id(sensor_name: str) -> str:
+    """Slug eines Sensornamens; gleiche Sensoren wiederholen sich je Gerät."""
+    return slugify(sensor_name)
+
+
+@dataclass(slots=True)
+class SensorAttributeMappings:
+    """Für alle Sensoren eines Setups gemeinsam geladene Zuordnungen."""
+
+    field_mapping: Dict[str, Any]
+    sensor_names: Mapping[str, str]
+    icons: Dict[str, str]
+    # Sensorname -> erste konfigurierte Kategorie
+    sensor_category_index: Dict[str, str]
+    device_class_mapping: Dict[str, Any]
+
+
+def _mapping_or_empty(result: Any, name: str) -> Any:
+    """Ersetzt eine fehlgeschlagene Zuordnung durch ein leeres Dict."""
+    if isinstance(result, Exception):
+        _LOGGER.warning("Error loading %s: %s", name, result)
+        return {}
+    return result
+
+
+async def _async_load_attribute_mappings(
+    config_service: ConfigServiceProtocol,
+) -> SensorAttributeMappings:
+    """Lädt alle für Sensor-Attribute benötigten Zuordnungen gemeinsam.
+
+    Nur ein Fehler beim Field-Mapping bricht ab; die übrigen Zuordnungen
+    fallen einzeln auf leere Werte zurück (Icon "mdi:sensor", keine
+    Device-Class, unübersetzter Name).
+    """
+    results = await asyncio.gather(
+        config_service.get_field_mapping(),
+        config_service.get_sensor_names(),
+        config_service.get_icons(),
+        config_service.get_sensor_categories(),
+        config_service.get_device_class_mapping(),
+        return_exceptions=True,
+    )
+    for result in results:
+        # Abbrüche (CancelledError) nicht als Ergebnis weiterreichen
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result
+    (
+        field_mapping,
+        sensor_names,
+        icons,
+        sensor_categories,
+        device_class_mapping,
+    ) = results
+    if isinstance(field_mapping, Exception):
+        raise field_mapping
+    # Fehlende Übersetzungen sind kein Grund, die Attribute zu verwerfen
+    if isinstance(sensor_names, Exception):
+        _LOGGER.debug("Konnte übersetzte Namen nicht laden: %s", sensor_names)
+        sensor_names = {}
+    icons = _mapping_or_empty(icons, "icons")
+    sensor_categories = _mapping_or_empty(sensor_categories, "sensor categories")
+    device_class_mapping = _mapping_or_empty(
+        device_class_mapping, "device class mapping"
+    )
+    sensor_category_index: Dict[str, str] = {}
+    for category, sensors in sensor_categories.items():
+        for sensor in sensors:
+            sensor_category_index.setdefault(sensor, category)
+    return SensorAttributeMappings(
+        field_mapping=field_mapping,
+        sensor_names=sensor_names,
+        icons=icons,
+        sensor_category_index=sensor_category_index,
+        device_class_mapping=device_class_mapping,
+    )
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -51,34 +198,86 @@ async def async_setup_entry(
     entities = []
 
     selected_devices = entry.data.get("selected_devices", [])
-    for device_id in selected_devices:
+    selected_median_entities = entry.data.get(
+        "selected_median_entities", []
+    )
+
+    # Attribut-Zuordnungen einmal für alle Sensoren laden; ohne sie lädt
+    # jede Entity ihre Zuordnungen beim Hinzufügen selbst
+    attribute_mappings: Optional[SensorAttributeMappings] = None
+    if selected_devices or selected_median_entities:
         try:
-            device_entities = await create_device_entities(
-                coordinator, device_id, config_service
+            attribute_mappings = await _async_load_attribute_mappings(
+                config_service
             )
-            entities.extend(device_entities)
         except Exception as err:
+            _LOGGER.warning("Error loading sensor attribute mappings: %s", err)
+
+    # Median-Konfiguration einmal laden; die Median-Entities entstehen
+    # danach ohne weitere Abfragen
+    median_infos: Dict[str, Dict[str, Any]] = {}
+    if selected_median_entities:
+        try:
+            median_infos = {
+                median["id"]: median
+                for median in await config_service.get_median_entities()
+                if "id" in median
+            }
+        except Exception:
+            _LOGGER.exception("Error loading median entities")
+
+        # Unbekannte Mediane vorab aussortieren statt je Median zu scheitern
+        unknown_medians = [
+            median_id
+            for median_id in selected_median_entities
+            if median_id not in median_infos
+        ]
+        if unknown_medians:
+            _LOGGER.warning(
+                "Median info not found for %s", ", ".join(unknown_medians)
+            )
+            selected_median_entities = [
+                median_id
+                for median_id in selected_median_entities
+                if median_id in median_infos
+            ]
+
+    # Konfigurationsabfragen aller Geräte überlappen lassen;
+    # ein fehlerhaftes Gerät bricht die übrigen nicht ab
+    device_results = await asyncio.gather(
+        *(
+            create_device_entities(
+                coordinator, device_id, config_service, attribute_mappings
+            )
+            for device_id in selected_devices
+        ),
+        return_exceptions=True,
+    )
+
+    for device_id, result in zip(selected_devices, device_results):
+        if isinstance(result, Exception):
             _LOGGER.error(
                 "Error setting up sensor entities for device %s: %s",
                 device_id,
-                err,
+                result,
+                exc_info=result,
             )
+            continue
+        entities.extend(result)
 
-    selected_median_entities = entry.data.get(
-        "selected_median_entities", []
-    )
     for median_id in selected_median_entities:
         try:
-            median_entities = await create_median_entities(
-                coordinator, median_id, config_service
-            )
-            entities.extend(median_entities)
-        except Exception as err:
-            _LOGGER.error(
-                "Error setting up median entities for %s: %s",
-                median_id,
-                err,
+            entities.extend(
+                create_median_entities(
+                    coordinator,
+                    median_id,
+                    median_infos[median_id],
+                    config_service,
+                    attribute_mappings,
+                )
             )
+        except Exception:
+            _LOGGER.exception("Error setting up median entities for %s", median_id)
 
     supplemental_coordinators = entry.runtime_data.supplemental_coordinators
     pollen_coordinator = supplemental_coordinators.get(DWD_POLLEN_SOURCE)
@@ -126,199 +325,171 @@ async def create_device_entities(
     coordinator: SensorBridgeCoordinator,
     device_id: str,
     config_service: ConfigServiceProtocol,
+    attribute_mappings: Optional[SensorAttributeMappings] = None,
 ) -> list[SensorBridgeSensor]:
     """Erstellt Entities für ein einzelnes Gerät."""
     entities = []
+    # Geräte- und Sensornamen teilen sich alle Entities und Datenabfragen
+    device_id = sys.intern(device_id)
 
+    # Device-Info laden
     try:
-        # Device-Info laden
         device_info = await config_service.get_device_by_id(device_id)
-        if not device_info:
-            _LOGGER.warning("Device info not found for %s", device_id)
-            return entities
-
-        # Sensoren des Geräts
-        sensors = device_info.get("sensors", [])
-
-        # 1) Gerätespezifische primäre Darstellung sicherstellen
-        device_type = device_info.get("type", "").lower()
-
-        # Für senseBox: dedizierte Meta-Entity zuerst (Icon: mdi:memory)
-        if device_type == "sensebox":
-            meta_entity_data = {
-                "device_id": device_id,
-                "sensor_type": "__device_meta",
-                "device_name": device_info.get("name", device_id),
-                "attributes": {
-                    "device_id": device_id,
-                    "device_name": device_info.get("name", device_id),
-                    "device_type": device_info.get("type", "senseBox"),
-                    "topic_pattern": device_info.get("topic_pattern"),
-                    "sensors": sensors,
-                    "sensors_count": len(sensors),
-                },
-            }
-            meta_entity = SensorBridgeSensor(coordinator, meta_entity_data, config_service)
-            # Icon-Override und Kategorie für Meta-Entity setzen
-            meta_entity._attr_icon = "mdi:memory"
-            meta_entity._attr_entity_category = EntityCategory.DIAGNOSTIC
-            entities.append(meta_entity)
-
-        # Für median: dedizierte Meta-Entity zuerst (Icon: mdi:chart-box-outline)
-        if device_type == "median":
-            meta_entity_data = {
-                "device_id": device_id,
-                "sensor_type": "__device_meta",
-                "device_name": device_info.get("name", device_id),
-                "attributes": {
-                    "device_id": device_id,
-                    "device_name": device_info.get("name", device_id),
-                    "device_type": device_info.get("type", "median"),
-                    "topic_pattern": device_info.get("topic_pattern"),
-                    "sensors": sensors,
-                    "sensors_count": len(sensors),
-                },
-            }
-            meta_entity = SensorBridgeSensor(coordinator, meta_entity_data, config_service)
-            meta_entity._attr_icon = "mdi:chart-box-outline"
-            meta_entity._attr_entity_category = EntityCategory.DIAGNOSTIC
-            entities.append(meta_entity)
-
-        # Für alle anderen Gerätetypen ebenfalls eine Meta-Entity (Icon je Typ)
-        if device_type not in ("sensebox", "median"):
-            meta_entity_data = {
-                "device_id": device_id,
-                "sensor_type": "__device_meta",
-                "device_name": device_info.get("name", device_id),
-                "attributes": {
-                    "device_id": device_id,
-                    "device_name": device_info.get("name", device_id),
-                    "device_type": device_info.get("type", device_type),
-                    "topic_pattern": device_info.get("topic_pattern"),
-                    "sensors": sensors,
-                    "sensors_count": len(sensors),
-                },
-            }
-            meta_entity = SensorBridgeSensor(coordinator, meta_entity_data, config_service)
-            # Icon abhängig vom Gerätetyp bestimmen
-            if device_type == "waterlevel":
-                meta_entity._attr_icon = "mdi:waves"
-            elif device_type == "temperature":
-                meta_entity._attr_icon = "mdi:thermometer"
-            else:
-                meta_entity._attr_icon = "mdi:sensor"
-            meta_entity._attr_entity_category = EntityCategory.DIAGNOSTIC
-            entities.append(meta_entity)
-
-        # 2) Sensor-Reihenfolge pro Typ: wichtigstes zuerst
-        if device_type == "waterlevel":
-            if "water_level" in sensors:
-                sensors = ["water_level"] + [s for s in sensors if s != "water_level"]
-        elif device_type == "temperature":
-            priority = ["LuftTemp", "TempC1", "TempC2", "WasserTemp", "WasserTemp_1", "WasserTemp_2"]
-            sensors = sorted(sensors, key=lambda s: (s not in priority, priority.index(s) if s in priority else 999))
-
-        for sensor_name in sensors:
-            unique_id = await _resolve_sensor_unique_id(
-                coordinator.hass, device_id, sensor_name, config_service
-            )
-            entity_data = {
-                "device_id": device_id,
-                "sensor_type": sensor_name,
-                "unique_id": unique_id,
-                "device_name": device_info.get("name", device_id),
-                "external_urls": device_info.get("external_urls", {}),
-                "attributes": {
-                    "device_id": device_id,
-                    "device_name": device_info.get("name", device_id),
-                    "sensor_type": sensor_name,
-                    "device_type": device_info.get("type", "unknown"),
-                },
-            }
+    except Exception:
+        _LOGGER.exception("Error loading device info for %s", device_id)
+        return entities
+    if not device_info:
+        _LOGGER.warning("Device info not found for %s", device_id)
+        return entities
 
-            entity = SensorBridgeSensor(
-                coordinator, entity_data, config_service
-            )
-            entities.append(entity)
+    # Sensoren des Geräts
+    sensors = device_info.get("sensors", [])
 
-        return entities
+    # 1) Gerätespezifische primäre Darstellung sicherstellen
+    device_type = device_info.get("type", "").lower()
+    device_name = device_info.get("name", device_id)
+
+    # Eine DeviceInfo für alle Entities des Geräts
+    external_urls = device_info.get("external_urls", {})
+    shared_device_info = _build_device_info(
+        device_id,
+        device_name,
+        external_urls.get("makerspace") or external_urls.get("openSenseMap"),
+    )
 
-    except Exception as e:
-        _LOGGER.error(
-            "Error creating device entities for %s: %s", device_id, e
+    # Dedizierte Meta-Entity zuerst, Icon je Gerätetyp
+    meta_entity_data = {
+        "device_id": device_id,
+        "sensor_type": "__device_meta",
+        "device_name": device_name,
+        "device_info": shared_device_info,
+        "attributes": {
+            "device_id": device_id,
+            "device_name": device_name,
+            "device_type": device_info.get("type", device_type),
+            "topic_pattern": device_info.get("topic_pattern"),
+            "sensors": sensors,
+            "sensors_count": len(sensors),
+        },
+    }
+    meta_entity = SensorBridgeSensor(
+        coordinator, meta_entity_data, config_service, attribute_mappings
+    )
+    # Icon-Override und Kategorie für Meta-Entity setzen
+    meta_entity._attr_icon = _META_ENTITY_ICONS.get(device_type, "mdi:sensor")
+    meta_entity._attr_entity_category = EntityCategory.DIAGNOSTIC
+    entities.append(meta_entity)
+
+    # 2) Sensor-Reihenfolge pro Typ: wichtigstes zuerst
+    if device_type == "waterlevel":
+        if "water_level" in sensors:
+            sensors = ["water_level"] + [s for s in sensors if s != "water_level"]
+    elif device_type == "temperature":
+        sensors = sorted(
+            sensors,
+            key=lambda s: _TEMPERATURE_SENSOR_PRIORITY.get(
+                s, len(_TEMPERATURE_SENSOR_PRIORITY)
+            ),
         )
-        return entities
+
+    # Für alle Sensoren des Geräts gleiche Werte nur einmal ermitteln
+    base_attributes = {
+        "device_id": device_id,
+        "device_name": device_name,
+        "device_type": device_info.get("type", "unknown"),
+    }
+
+    for sensor_name in sensors:
+        sensor_name = sys.intern(sensor_name)
+        unique_id = await _resolve_sensor_unique_id(
+            coordinator.hass, device_id, sensor_name, config_service
+        )
+        entity_data = {
+            "device_id": device_id,
+            "sensor_type": sensor_name,
+            "unique_id": unique_id,
+            "device_name": device_name,
+            "device_info": shared_device_info,
+            "attributes": {**base_attributes, "sensor_type": sensor_name},
+        }
+
+        entity = SensorBridgeSensor(
+            coordinator, entity_data, config_service, attribute_mappings
+        )
+        entities.append(entity)
+
+    return entities
 
 
-async def create_median_entities(
+@callback
+def create_median_entities(
     coordinator: SensorBridgeCoordinator,
     median_id: str,
+    median_info: Optional[Dict[str, Any]],
     config_service: ConfigServiceProtocol,
+    attribute_mappings: Optional[SensorAttributeMappings] = None,
 ) -> list[SensorBridgeSensor]:
-    """Erstellt Entities für Median-Daten."""
+    """Erstellt Entities für Median-Daten aus der geladenen Median-Info."""
     entities = []
+    median_id = sys.intern(median_id)
 
-    try:
-        # Median-Info laden
-        median_info = await config_service.get_median_by_id(median_id)
-        if not median_info:
-            _LOGGER.warning("Median info not found for %s", median_id)
-            return entities
+    if not median_info:
+        _LOGGER.warning("Median info not found for %s", median_id)
+        return entities
 
-        # Sensoren des Medians
-        sensors = median_info.get("sensors", [])
+    # Sensoren des Medians
+    sensors = median_info.get("sensors", [])
 
-        # Meta-Entity (Diagnose) anlegen, damit Geräte-Icon/Status klar ist
-        try:
-            from homeassistant.helpers.entity import EntityCategory
-        except Exception:
-            EntityCategory = None  # type: ignore
+    # Eine DeviceInfo für alle Entities des Medians
+    median_name = median_info.get("name", median_id)
+    shared_device_info = _build_device_info(median_id, median_name)
 
-        meta_entity_data = {
+    # Meta-Entity (Diagnose) anlegen, damit Geräte-Icon/Status klar ist
+    meta_entity_data = {
+        "device_id": median_id,
+        "sensor_type": "__device_meta",
+        "device_name": median_name,
+        "device_info": shared_device_info,
+        "attributes": {
+            "device_id": median_id,
+            "device_name": median_name,
+            "device_type": "median",
+            "location": median_info.get("location", ""),
+            "sensors": sensors,
+            "sensors_count": len(sensors),
+        },
+    }
+    meta_entity = SensorBridgeSensor(
+        coordinator, meta_entity_data, config_service, attribute_mappings
+    )
+    meta_entity._attr_icon = "mdi:chart-box-outline"
+    meta_entity._attr_entity_category = EntityCategory.DIAGNOSTIC
+    entities.append(meta_entity)
+
+    # Für alle Sensoren des Medians gleiche Werte nur einmal ermitteln
+    base_attributes = {
+        "device_id": median_id,
+        "device_name": median_name,
+        "device_type": "median",
+        "location": median_info.get("location", ""),
+    }
+
+    for sensor_name in sensors:
+        sensor_name = sys.intern(sensor_name)
+        entity_data = {
             "device_id": median_id,
-            "sensor_type": "__device_meta",
-            "device_name": median_info.get("name", median_id),
-            "attributes": {
-                "device_id": median_id,
-                "device_name": median_info.get("name", median_id),
-                "device_type": "median",
-                "location": median_info.get("location", ""),
-                "sensors": sensors,
-                "sensors_count": len(sensors),
-            },
+            "sensor_type": sensor_name,
+            "device_name": median_name,
+            "device_info": shared_device_info,
+            "attributes": {**base_attributes, "sensor_type": sensor_name},
         }
-        meta_entity = SensorBridgeSensor(coordinator, meta_entity_data, config_service)
-        meta_entity._attr_icon = "mdi:chart-box-outline"
-        if EntityCategory is not None:
-            meta_entity._attr_entity_category = EntityCategory.DIAGNOSTIC
-        entities.append(meta_entity)
-
-        for sensor_name in sensors:
-            entity_data = {
-                "device_id": median_id,
-                "sensor_type": sensor_name,
-                "device_name": median_info.get("name", median_id),
-                "attributes": {
-                    "device_id": median_id,
-                    "device_name": median_info.get("name", median_id),
-                    "sensor_type": sensor_name,
-                    "device_type": "median",
-                    "location": median_info.get("location", ""),
-                },
-            }
-
-            entity = SensorBridgeSensor(
-                coordinator, entity_data, config_service
-            )
-            entities.append(entity)
 
-        return entities
-
-    except Exception as e:
-        _LOGGER.error(
-            "Error creating median entities for %s: %s", median_id, e
+        entity = SensorBridgeSensor(
+            coordinator, entity_data, config_service, attribute_mappings
         )
-        return entities
+        entities.append(entity)
+
+    return entities
 
 
 async def _resolve_sensor_unique_id(
@@ -342,24 +513,59 @@ async def _resolve_sensor_unique_id(
     return canonical_unique_id
 
 
-class SensorBridgeSensor(SensorEntity):
+class SensorBridgeSensor(
+    CoordinatorEntity[SensorBridgeCoordinator],
+    SensorEntity,
+):
     """SensorBridge Sensor Entity."""
 
+    # Eigene Instanzfelder als Slots; die HA-Basisklassen behalten ihr __dict__
+    __slots__ = (
+        "entity_data",
+        "config_service",
+        "_attribute_mappings",
+        "_device_id",
+        "_sensor_name",
+        "_is_meta",
+        "_device_type",
+        "_base_attributes",
+        "_has_last_seen",
+        "_has_effective_stale",
+        "_stale_after",
+        "_suggested_object_id",
+    )
+
     def __init__(
         self,
         coordinator: SensorBridgeCoordinator,
         entity_data: Dict[str, Any],
         config_service: ConfigServiceProtocol,
+        attribute_mappings: Optional[SensorAttributeMappings] = None,
     ) -> None:
         """Initialize the sensor."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self.entity_data = entity_data
         self.config_service = config_service
+        self._attribute_mappings = attribute_mappings
 
         # Entity-Attribute setzen
         device_id = entity_data.get("device_id", "")
         sensor_name = entity_data.get("sensor_type", "")
 
+        # Unveränderliche Schlüssel für die häufig gelesenen Properties
+        self._device_id = device_id
+        self._sensor_name = sensor_name
+        self._is_meta = sensor_name == "__device_meta"
+        self._base_attributes: Dict[str, Any] = entity_data.get("attributes", {})
+        self._device_type = self._base_attributes.get("device_type")
+
+        # Verfügbare Coordinator-Schnittstellen einmal prüfen statt je Zugriff
+        self._has_last_seen = hasattr(coordinator, "get_device_last_seen")
+        self._has_effective_stale = hasattr(
+            coordinator, "get_effective_stale_seconds"
+        )
+        self._stale_after: Optional[int] = None
+
         self._attr_unique_id = entity_data.get(
             "unique_id", f"{device_id}_{sensor_name}"
         )
@@ -371,7 +577,7 @@ class SensorBridgeSensor(SensorEntity):
 
         # Mit `has_entity_name=True` stellt Home Assistant den Gerätenamen
         # automatisch voran. Der Vorschlag enthält deshalb nur den Sensornamen.
-        object_id = slugify(sensor_name)
+        object_id = _sensor_object_id(sensor_name)
         self._suggested_object_id = object_id
 
         self._attr_has_entity_name = True
@@ -388,35 +594,17 @@ class SensorBridgeSensor(SensorEntity):
         else:
             self._attr_state_class = SensorStateClass.MEASUREMENT
 
-        # Device-Info setzen (ohne via_device)
-        external_urls = entity_data.get("external_urls", {})
-        makerspace_url = external_urls.get("makerspace")
-        opensensemap_url = external_urls.get("openSenseMap")
-
-        configuration_url = makerspace_url or opensensemap_url
-
-        device_info_kwargs: Dict[str, Any] = {
-            "identifiers": {(DOMAIN, device_id)},
-            "name": device_name,
-            "manufacturer": MANUFACTURER,
-            "model": device_id,
-        }
-
-        if configuration_url:
-            device_info_kwargs["configuration_url"] = configuration_url
-
-        self._attr_device_info = DeviceInfo(**device_info_kwargs)
-
-        _LOGGER.info("=== SENSOR CREATION DEBUG ===")
-        _LOGGER.info("Created sensor: %s", self._attr_unique_id)
-        _LOGGER.info("suggested_object_id: %s | entity_id(now): %s", object_id, getattr(self, "entity_id", None))
-        _LOGGER.info("translation_key: %s", self._attr_translation_key)
-        _LOGGER.info("has_entity_name: %s", self._attr_has_entity_name)
-        _LOGGER.info("device_name: %s", device_name)
-        _LOGGER.info("sensor_name: %s", sensor_name)
+        # Geteilte Device-Info der Factory nutzen, sonst eigene anlegen
+        self._attr_device_info = entity_data.get(
+            "device_info"
+        ) or _build_device_info(device_id, device_name)
 
-        # Debug-Translation-Test nicht automatisch ausführen
-        self.hass = None  # Wird in async_added_to_hass gesetzt
+        _LOGGER.debug(
+            "Created sensor %s (device: %s, suggested_object_id: %s)",
+            self._attr_unique_id,
+            device_name,
+            object_id,
+        )
 
     @property
     @override
@@ -428,16 +616,12 @@ class SensorBridgeSensor(SensorEntity):
         """Wird aufgerufen wenn Entity zu Home Assistant hinzugefügt wird."""
         await super().async_added_to_hass()
 
-        # Hass-Referenz setzen
-        self.hass = self.coordinator.hass
-        # Kein automatischer Translation-Test (reduziert Log-Lärm)
-
         # Sensor-Attribute laden
         await self._load_sensor_attributes()
 
         # Repräsentative HA-Entity dem Coordinator melden (für Logbuch-Zuordnung)
         try:
-            device_id = self.entity_data.get("device_id")
+            device_id = self._device_id
             if device_id and hasattr(self.coordinator, "register_ha_entity_for_device"):
                 self.coordinator.register_ha_entity_for_device(device_id, self.entity_id)
         except Exception:
@@ -445,8 +629,8 @@ class SensorBridgeSensor(SensorEntity):
 
         # Geräte-Icon anhand der Diagnose-Entität auf das Gerät anwenden
         try:
-            if self.entity_data.get("sensor_type") == "__device_meta":
-                device_id = self.entity_data.get("device_id")
+            if self._is_meta:
+                device_id = self._device_id
                 if device_id:
                     device_registry = dr.async_get(self.coordinator.hass)
                     dev = device_registry.async_get_device(identifiers={(DOMAIN, device_id)})
@@ -456,16 +640,8 @@ class SensorBridgeSensor(SensorEntity):
         except Exception as e:
             _LOGGER.debug("Konnte Geräte-Icon nicht setzen: %s", e)
 
-        # Coordinator-Update-Callback registrieren
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
-
-        # Initialen State sofort schreiben, damit neue State-Texte (z. B. Deutsch) direkt sichtbar sind
-        try:
-            self.async_write_ha_state()
-        except Exception:
-            pass
+        # Den ersten State schreibt Home Assistant direkt nach dem Hinzufügen,
+        # dann bereits mit den geladenen Attributen
 
         _LOGGER.debug(
             "SensorBridge sensor added to hass: %s", self._attr_unique_id
@@ -473,290 +649,200 @@ class SensorBridgeSensor(SensorEntity):
 
     async def _load_sensor_attributes(self) -> None:
         """Lädt die Sensor-Attribute aus der Konfiguration."""
-        try:
-            sensor_name = self.entity_data.get("sensor_type", "")
-
-            # Field-Mapping laden
-            field_mapping = await self.config_service.get_field_mapping()
-            units = field_mapping.get("units", {})
-            device_classes = field_mapping.get("device_classes", {})
-
-            # Unit setzen
-            unit = units.get(sensor_name)
-            if unit:
-                self._attr_native_unit_of_measurement = unit
-
-            # Device-Class setzen
-            device_class_str = device_classes.get(sensor_name)
-            if device_class_str:
-                self._attr_device_class = await self._get_device_class(
-                    device_class_str
-                )
+        sensor_name = self._sensor_name
 
-            # Icon setzen (für Meta explizit lassen)
-            if sensor_name != "__device_meta":
-                self._attr_icon = await self._get_sensor_icon(
-                    sensor_name, device_class_str
+        # Beim Setup gemeinsam geladene Zuordnungen nutzen
+        mappings = self._attribute_mappings
+        if mappings is None:
+            try:
+                mappings = await _async_load_attribute_mappings(
+                    self.config_service
+                )
+            except Exception:
+                _LOGGER.exception(
+                    "Error loading sensor attributes for %s", self._attr_unique_id
                 )
+                return
 
-            # Anzeigename aus Übersetzung auffüllen, damit die UI-Felder nicht leer sind
-            try:
-                sensor_names = await self.config_service.get_sensor_names()
-                translated = sensor_names.get(sensor_name)
-                self._attr_name = translated or sensor_name
-            except Exception as name_err:
-                _LOGGER.debug("Konnte übersetzten Namen nicht laden: %s", name_err)
-                self._attr_name = sensor_name
-
-            # Device-Info setzen (ohne via_device)
-            device_id = self.entity_data.get("device_id")
-            if device_id:
-                external_urls = self.entity_data.get("external_urls", {})
-                makerspace_url = external_urls.get("makerspace")
-                opensensemap_url = external_urls.get("openSenseMap")
-
-                configuration_url = makerspace_url or opensensemap_url
-
-                device_info_kwargs: Dict[str, Any] = {
-                    "identifiers": {(DOMAIN, device_id)},
-                    "name": self.entity_data.get("device_name", device_id),
-                    "manufacturer": MANUFACTURER,
-                    "model": device_id,
-                }
-                if configuration_url:
-                    device_info_kwargs["configuration_url"] = configuration_url
-
-                self._attr_device_info = DeviceInfo(**device_info_kwargs)
-
-            _LOGGER.info(
-                "Sensor attributes loaded for %s: "
-                "translation_key='%s', unit='%s', device_class='%s', "
-                "icon='%s'",
-                self._attr_unique_id,
-                self._attr_translation_key,
-                unit,
+        units = mappings.field_mapping.get("units", {})
+        device_classes = mappings.field_mapping.get("device_classes", {})
+
+        # Unit setzen
+        unit = units.get(sensor_name)
+        if unit:
+            self._attr_native_unit_of_measurement = unit
+
+        # Device-Class setzen
+        device_class_str = device_classes.get(sensor_name)
+        if device_class_str:
+            self._attr_device_class = self._get_device_class(
+                device_class_str, mappings.device_class_mapping
+            )
+
+        # Icon setzen (für Meta explizit lassen)
+        if not self._is_meta:
+            self._attr_icon = self._get_sensor_icon(
+                sensor_name,
                 device_class_str,
-                self._attr_icon,
+                mappings.icons,
+                mappings.sensor_category_index,
             )
 
-            # Namen-Änderungen ggf. in den Zustand übernehmen
-            # Meta-Entity schreibt den State sehr früh ohnehin; doppelte Logbucheinträge vermeiden
-            if sensor_name != "__device_meta":
-                self.async_write_ha_state()
+        # Anzeigename aus Übersetzung auffüllen, damit die UI-Felder nicht leer sind
+        translated = mappings.sensor_names.get(sensor_name)
+        self._attr_name = translated or sensor_name
 
-        except Exception as e:
-            _LOGGER.error("Error loading sensor attributes: %s", e)
+        _LOGGER.debug(
+            "Sensor attributes loaded for %s: "
+            "translation_key='%s', unit='%s', device_class='%s', "
+            "icon='%s'",
+            self._attr_unique_id,
+            self._attr_translation_key,
+            unit,
+            device_class_str,
+            self._attr_icon,
+        )
 
-    async def _get_device_class(
-        self, device_class_str: str
+    @callback
+    def _get_device_class(
+        self, device_class_str: str, device_class_mapping: Dict[str, Any]
     ) -> Optional[SensorDeviceClass]:
         """Konvertiert String zu SensorDeviceClass."""
-        try:
-            # Device Class Mapping aus der Konfiguration laden
-            device_class_mapping = (
-                await self.config_service.get_device_class_mapping()
-            )
-
-            # Device Class Enum aus der Konfiguration holen
-            device_class_enum = device_class_mapping.get(device_class_str)
+        # Device Class Enum aus der Konfiguration holen
+        device_class_enum = device_class_mapping.get(device_class_str)
 
-            if device_class_enum:
-                return device_class_enum
+        if device_class_enum:
+            return device_class_enum
 
-            _LOGGER.warning("Unknown device class: %s", device_class_str)
-            return None
-
-        except Exception as e:
-            _LOGGER.error(
-                "Error converting device class %s: %s", device_class_str, e
-            )
-            return None
+        _LOGGER.warning("Unknown device class: %s", device_class_str)
+        return None
 
-    async def _get_sensor_icon(
-        self, sensor_name: str, device_class_str: Optional[str]
+    @callback
+    def _get_sensor_icon(
+        self,
+        sensor_name: str,
+        device_class_str: Optional[str],
+        icons: Dict[str, str],
+        sensor_category_index: Dict[str, str],
     ) -> str:
         """Bestimmt das Icon für einen Sensor."""
-        try:
-            # Icon-Mapping aus Konfiguration laden
-            icons = await self.config_service.get_icons()
-
-            # Sensor-Kategorien laden
-            sensor_categories = (
-                await self.config_service.get_sensor_categories()
-            )
-
-            # Sensor-Kategorie bestimmen
-            sensor_category = "unknown"
-            for category, sensors in sensor_categories.items():
-                if sensor_name in sensors:
-                    sensor_category = category
-                    break
-
-            # Icon basierend auf Device-Class (höchste Priorität)
-            if device_class_str and device_class_str in icons:
-                return icons[device_class_str]
+        # Icon basierend auf Device-Class (höchste Priorität)
+        if device_class_str and device_class_str in icons:
+            return icons[device_class_str]
 
-            # Icon basierend auf Sensor-Kategorie
-            if sensor_category in icons:
-                return icons[sensor_category]
+        # Icon basierend auf Sensor-Kategorie
+        sensor_category = sensor_category_index.get(sensor_name, "unknown")
+        if sensor_category in icons:
+            return icons[sensor_category]
 
-            # Default-Icon aus Konfiguration
-            return icons.get("default", "mdi:sensor")
-
-        except Exception as e:
-            _LOGGER.error("Error determining sensor icon: %s", e)
-            return "mdi:sensor"
+        # Default-Icon aus Konfiguration
+        return icons.get("default", "mdi:sensor")
 
     def _format_duration(self, seconds: float) -> str:
         """Formatiert eine Dauer kurz (z. B. 'vor 5 min', 'vor 2 Std.')."""
         try:
             total_seconds = int(max(0, round(seconds)))
-            if total_seconds < 60:
-                return f"vor {total_seconds} s"
-
-            total_minutes = total_seconds // 60
-            if total_minutes < 60:
-                return f"vor {total_minutes} min"
-
-            total_hours = total_minutes // 60
-            if total_hours < 24:
-                rem_min = total_minutes % 60
-                if rem_min:
-                    return f"vor {total_hours} Std. {rem_min} min"
-                return f"vor {total_hours} Std."
-
-            total_days = total_hours // 24
-            rem_hours = total_hours % 24
-            if rem_hours:
-                return f"vor {total_days} Tg. {rem_hours} Std."
-            return f"vor {total_days} Tg."
+            formatter = _DURATION_FORMATTERS[
+                bisect_right(_DURATION_THRESHOLDS, total_seconds)
+            ]
+            return formatter(total_seconds)
         except Exception:
             return "vor 1 s"
 
+    def _get_last_seen(self) -> Optional[float]:
+        """Gibt den Last-Seen-Zeitpunkt des Geräts zurück, falls bekannt."""
+        if not self._has_last_seen:
+            return None
+        return self.coordinator.get_device_last_seen(self._device_id)
+
+    def _get_stale_after(self) -> int:
+        """Gibt den effektiven Stale-Threshold des Geräts in Sekunden zurück.
+
+        Die Schwellen stehen nach dem Coordinator-Start fest und ändern sich
+        erst mit einem Reload, der die Entities neu anlegt.
+        """
+        stale_after = self._stale_after
+        if stale_after is None:
+            stale_after = 300
+            if self._has_effective_stale:
+                stale_after = int(
+                    self.coordinator.get_effective_stale_seconds(
+                        self._device_id, self._device_type
+                    )
+                )
+            self._stale_after = stale_after
+        return stale_after
+
     @property
     def native_value(self) -> StateType:
         """Gibt den aktuellen Sensor-Wert zurück."""
-        device_id = self.entity_data.get("device_id")
-        sensor_name = self.entity_data.get("sensor_type")
+        device_id = self._device_id
 
         # Meta-Entity: Online/Stale/Offline Status
-        if sensor_name == "__device_meta":
+        if self._is_meta:
             # Als textueller Sensor behandeln
             self._attr_device_class = None
             self._attr_native_unit_of_measurement = None
-            # MQTT verbunden?
-            mqtt_connected = False
-            try:
-                mqtt_connected = bool(self.coordinator.mqtt_service.is_connected)
-            except Exception:
-                mqtt_connected = False
-
-            # Last Seen und Threshold
-            last_seen = None
-            try:
-                if hasattr(self.coordinator, "get_device_last_seen"):
-                    last_seen = self.coordinator.get_device_last_seen(device_id)
-            except Exception:
-                last_seen = None
-
-            # Threshold bestimmen
-            stale_after = 300
-            try:
-                device_type = self.entity_data.get("attributes", {}).get("device_type")
-                if hasattr(self.coordinator, "get_effective_stale_seconds"):
-                    stale_after = int(self.coordinator.get_effective_stale_seconds(device_id, device_type))
-            except Exception:
-                pass
 
             # Statuslogik
-            if not mqtt_connected:
+            if not self.coordinator.mqtt_service.is_connected:
                 return "Offline"
+            last_seen = self._get_last_seen()
             if last_seen is None:
                 return "Veraltet"
-            import time as _t
-            return "Online" if (_t.monotonic() - last_seen) <= stale_after else "Veraltet"
+            if (time.monotonic() - last_seen) <= self._get_stale_after():
+                return "Online"
+            return "Veraltet"
 
-        if not device_id or not sensor_name:
+        if not device_id or not self._sensor_name:
             return None
 
         # Daten vom Coordinator holen
         coordinator_data = self.coordinator.data
-        device_data = coordinator_data.get(device_id, {})
-
-        return device_data.get(sensor_name)
+        if not coordinator_data:
+            return None
+        return coordinator_data.get(device_id, _EMPTY_DEVICE_DATA).get(
+            self._sensor_name
+        )
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Gibt zusätzliche Entity-Attribute zurück."""
-        attrs = dict(self.entity_data.get("attributes", {}))
+        attrs = self._base_attributes.copy()
         # Zusätzliche Diagnoseattribute
-        try:
-            mqtt_connected = getattr(self.coordinator.mqtt_service, "is_connected", False)
-            attrs["mqtt_connected"] = "Ja" if bool(mqtt_connected) else "Nein"
-            device_id = self.entity_data.get("device_id")
-            last_seen = None
-            if hasattr(self.coordinator, "get_device_last_seen"):
-                last_seen = self.coordinator.get_device_last_seen(device_id)
-            if last_seen is not None:
-                delta_seconds = max(0.0, time.monotonic() - last_seen)
-                attrs["last_seen"] = self._format_duration(delta_seconds)
-            # Für Meta-Entity: zusätzliche Schwelle und Sensorliste/Topic
-            if self.entity_data.get("sensor_type") == "__device_meta":
-                # Threshold
-                try:
-                    device_type = attrs.get("device_type")
-                    if hasattr(self.coordinator, "get_effective_stale_seconds"):
-                        threshold_seconds = int(
-                            self.coordinator.get_effective_stale_seconds(device_id, device_type)
-                        )
-                        # In Minuten ausgeben, da UI/Config in Minuten arbeitet
-                        attrs["inactivity_threshold_minutes"] = int(round(threshold_seconds / 60))
-                except Exception:
-                    pass
-                # Sensors/Topic sind für Meta-Entity bereits in attributes enthalten
-        except Exception:
-            pass
+        mqtt_connected = self.coordinator.mqtt_service.is_connected
+        attrs["mqtt_connected"] = "Ja" if mqtt_connected else "Nein"
+        last_seen = self._get_last_seen()
+        if last_seen is not None:
+            delta_seconds = max(0.0, time.monotonic() - last_seen)
+            attrs["last_seen"] = self._format_duration(delta_seconds)
+        # Für Meta-Entity: zusätzliche Schwelle; Sensorliste/Topic sind
+        # bereits in attributes enthalten
+        if self._is_meta and self._has_effective_stale:
+            # In Minuten ausgeben, da UI/Config in Minuten arbeitet
+            attrs["inactivity_threshold_minutes"] = int(
+                round(self._get_stale_after() / 60)
+            )
         return attrs
 
     @property
     def available(self) -> bool:
         """Gibt zurück ob der Sensor verfügbar ist."""
         # Meta-Entity soll immer verfügbar sein, Status steckt im State
-        if self.entity_data.get("sensor_type") == "__device_meta":
+        if self._is_meta:
             return True
         # Globaler Coordinator-Status und MQTT-Verbindung
-        if not self.coordinator.last_update_success:
+        if not super().available:
             return False
-        try:
-            if not self.coordinator.mqtt_service.is_connected:
-                return False
-        except Exception:
-            # Fallback auf Coordinator-State
+        if not self.coordinator.mqtt_service.is_connected:
             return False
 
         # Stale-Detection pro Gerät
-        device_id = self.entity_data.get("device_id")
-        last_seen = None
-        if hasattr(self.coordinator, "get_device_last_seen"):
-            last_seen = self.coordinator.get_device_last_seen(device_id)
+        last_seen = self._get_last_seen()
         if last_seen is None:
             # Noch keine Daten empfangen → nicht als unavailable markieren
             return True
-        stale_after = 300
-        # Gerätetyp bestimmen (für per-type Stale)
-        device_type = self.entity_data.get("attributes", {}).get("device_type")
-        # Effektiven Threshold vom Coordinator holen, falls verfügbar
-        if hasattr(self.coordinator, "get_effective_stale_seconds"):
-            try:
-                stale_after = int(self.coordinator.get_effective_stale_seconds(self.entity_data.get("device_id"), device_type))
-            except Exception:
-                pass
-        elif hasattr(self.coordinator, "get_stale_after_seconds"):
-            try:
-                stale_after = int(self.coordinator.get_stale_after_seconds())
-            except Exception:
-                pass
-        return (time.monotonic() - last_seen) <= stale_after
+        return (time.monotonic() - last_seen) <= self._get_stale_after()
 
     async def async_will_remove_from_hass(self) -> None:
         """Wird aufgerufen wenn Entity aus Home Assistant entfernt wird."""
@@ -765,93 +851,3 @@ class SensorBridgeSensor(SensorEntity):
         _LOGGER.debug(
             "SensorBridge sensor removed from hass: %s", self._attr_unique_id
         )
-
-    async def test_translation(self) -> Dict[str, Any]:
-        """Test-Methode um die Translation-Funktionalität zu validieren."""
-        try:
-            sensor_name = self.entity_data.get("sensor_type", "")
-            device_name = self.entity_data.get("device_name", "")
-
-            # Translation-Info sammeln
-            test_result = {
-                "unique_id": self._attr_unique_id,
-                "translation_key": self._attr_translation_key,
-                "has_entity_name": self._attr_has_entity_name,
-                "current_name": self._attr_name,
-                "device_name": device_name,
-                "sensor_name": sensor_name,
-            }
-
-            _LOGGER.info(
-                "Translation Test für %s: %s",
-                self._attr_unique_id,
-                test_result,
-            )
-            return test_result
-
-        except Exception as e:
-            _LOGGER.error("Fehler beim Translation-Test: %s", e)
-
-            return {"error": str(e)}
-
-    async def force_name_update(self) -> None:
-        """Erzwingt ein Update des Entity-Namens."""
-        try:
-            # Entity-State aktualisieren
-            self.async_write_ha_state()
-            _LOGGER.info(
-                "Entity-Name Update erzwungen für %s", self._attr_unique_id
-            )
-        except Exception as e:
-            _LOGGER.error("Fehler beim erzwungenen Name-Update: %s", e)
-
-    async def _test_translation_on_add(self) -> None:
-        """Testet die Translation beim Hinzufügen zur Hass."""
-        try:
-            sensor_name = self.entity_data.get("sensor_type", "")
-
-            # Translation-API direkt testen
-
-            from homeassistant.helpers.translation import (
-                async_get_translations,
-            )
-
-            translations = await async_get_translations(
-                self.hass, self.hass.config.language, "entity", [DOMAIN]
-            )
-
-            # Korrekte Struktur basierend auf de.json:
-            # entity.sensor.{sensor_name}.name
-            entity_translations = translations.get("entity", {})
-            sensor_translations = entity_translations.get("sensor", {})
-
-            _LOGGER.info(
-                "=== TRANSLATION TEST für %s ===", self._attr_unique_id
-            )
-            _LOGGER.info("Language: %s", self.hass.config.language)
-            _LOGGER.info("Domain: %s", DOMAIN)
-
-            if sensor_name in sensor_translations:
-                sensor_data = sensor_translations[sensor_name]
-                if isinstance(sensor_data, dict) and "name" in sensor_data:
-                    _LOGGER.info(
-                        "Translation gefunden für %s: %s",
-                        sensor_name,
-                        sensor_data["name"],
-                    )
-                else:
-                    _LOGGER.warning(
-                        "Invalid translation structure for %s: %s",
-                        sensor_name,
-                        sensor_data,
-                    )
-            else:
-                _LOGGER.warning(
-                    "KEINE Translation gefunden für Key: %s", sensor_name
-                )
-                _LOGGER.warning(
-                    "Verfügbare Keys: %s", list(sensor_translations.keys())
-                )
-
-        except Exception as e:
-            _LOGGER.error("Fehler beim Translation-Test: %s", e)
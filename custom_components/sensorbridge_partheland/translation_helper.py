@@ -5,165 +5,227 @@ HA 2025 Compliant - Native Übersetzungsfunktionen
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Dict, Optional, Any
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Any, Tuple
 
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.translation import async_get_translations
 
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fehler, die beim Laden der Übersetzungen erwartet und abgefangen werden
+_TRANSLATION_ERRORS = (HomeAssistantError, asyncio.TimeoutError)
+
+# Übersetzungskategorien, die die Integration liest
+_TRANSLATION_CATEGORIES = ("entity", "config", "state")
+
+# Gemeinsamer leerer Fallback für fehlende Übersetzungen
+_EMPTY_TRANSLATIONS: Dict[str, str] = {}
+
 
 class TranslationHelper:
     """HA 2025 Translation Helper für native Übersetzungsfunktionen."""
+
+    __slots__ = ("hass", "_cache", "_locks", "_sensor_names_cache")
     
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialisiert den Translation Helper."""
         self.hass = hass
+        # Übersetzungen je (Sprache, Kategorie); ein Sprachwechsel trifft
+        # automatisch einen neuen Schlüssel
+        self._cache: Dict[Tuple[str, str], Mapping[str, Any]] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        # Aufbereitete Sensor-Namen je Sprache
+        self._sensor_names_cache: Dict[str, Mapping[str, str]] = {}
+
+    async def _async_get_translations(
+        self, language: str, category: str
+    ) -> Mapping[str, Any]:
+        """Lädt die Übersetzungen einer Kategorie einmal je Sprache.
+
+        Der Cache wird als schreibgeschützte Sicht geteilt, damit Aufrufer
+        ihn ohne Kopie lesen, aber nicht verändern können.
+        """
+        key = (language, category)
+        translations = self._cache.get(key)
+        if translations is not None:
+            return translations
+
+        # Gleichzeitige Aufrufer warten auf denselben Ladevorgang
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            translations = self._cache.get(key)
+            if translations is None:
+                translations = MappingProxyType(
+                    await async_get_translations(
+                        self.hass, language, category, [DOMAIN]
+                    )
+                )
+                self._cache[key] = translations
+        return translations
     
-    async def get_sensor_names(self) -> Dict[str, str]:
+    async def async_prefetch(self) -> None:
+        """Lädt alle genutzten Übersetzungskategorien vorab in den Cache."""
+        language = self.hass.config.language
+        results = await asyncio.gather(
+            *(
+                self._async_get_translations(language, category)
+                for category in _TRANSLATION_CATEGORIES
+            ),
+            return_exceptions=True,
+        )
+        for category, result in zip(_TRANSLATION_CATEGORIES, results):
+            if isinstance(result, Exception):
+                # Die Getter laden beim ersten Zugriff erneut
+                _LOGGER.debug(
+                    "Übersetzungen (%s) konnten nicht vorab geladen werden: %s",
+                    category,
+                    result,
+                )
+
+    async def get_sensor_names(self) -> Mapping[str, str]:
         """Gibt die Sensor-Namen-Übersetzungen zurück (Legacy-Support)."""
-        try:
-            translations = await async_get_translations(
-                self.hass, self.hass.config.language, "entity", [DOMAIN]
-            )
+        language = self.hass.config.language
+        cached = self._sensor_names_cache.get(language)
+        if cached is not None:
+            return cached
 
-            sensor_names: Dict[str, str] = {}
-
-            # HA kann verschachtelte oder flache Schlüssel liefern
-            entity_translations = translations.get("entity")
-            if isinstance(entity_translations, dict):
-                sensor_translations = entity_translations.get("sensor", {})
-                for sensor_key, sensor_data in sensor_translations.items():
-                    if isinstance(sensor_data, dict) and "name" in sensor_data:
-                        sensor_names[sensor_key] = sensor_data["name"]
-            else:
-                for key, value in translations.items():
-                    if "entity.sensor." in key and key.endswith(".name"):
-                        key_part = key.split("entity.sensor.", 1)[1]
-                        sensor_key = key_part.rsplit(".name", 1)[0]
-                        sensor_names[sensor_key] = value
-
-            _LOGGER.debug(
-                "Sensor-Namen aus HA 2025 Übersetzungen geladen: %s", sensor_names
-            )
-            return sensor_names
-            
-        except Exception as e:
+        try:
+            translations = await self._async_get_translations(language, "entity")
+        except _TRANSLATION_ERRORS as e:
             _LOGGER.warning("Fehler beim Laden der Sensor-Namen-Übersetzungen: %s", e)
             return {}
+
+        sensor_names: Dict[str, str] = {}
+
+        # HA kann verschachtelte oder flache Schlüssel liefern
+        entity_translations = translations.get("entity")
+        if isinstance(entity_translations, dict):
+            sensor_names = {
+                sensor_key: sensor_data["name"]
+                for sensor_key, sensor_data in entity_translations.get(
+                    "sensor", {}
+                ).items()
+                if isinstance(sensor_data, dict) and "name" in sensor_data
+            }
+        else:
+            for key, value in translations.items():
+                if "entity.sensor." in key and key.endswith(".name"):
+                    key_part = key.split("entity.sensor.", 1)[1]
+                    sensor_key = key_part.rsplit(".name", 1)[0]
+                    sensor_names[sensor_key] = value
+
+        _LOGGER.debug(
+            "%d Sensor-Namen aus HA 2025 Übersetzungen geladen", len(sensor_names)
+        )
+        cached = MappingProxyType(sensor_names)
+        self._sensor_names_cache[language] = cached
+        return cached
     
-    async def get_device_categories(self) -> Dict[str, str]:
+    async def get_device_categories(self) -> Mapping[str, str]:
         """Gibt die Geräte-Kategorien-Übersetzungen zurück."""
         try:
-            translations = await async_get_translations(
-                self.hass, self.hass.config.language, "entity", [DOMAIN]
+            translations = await self._async_get_translations(
+                self.hass.config.language, "entity"
             )
-            
-            # Korrekte Struktur: entity.device_categories
-            entity_translations = translations.get("entity", {})
-            device_categories = entity_translations.get("device_categories", {})
-            
-            _LOGGER.debug("Geräte-Kategorien aus Übersetzungen geladen: %s", device_categories)
-            return device_categories
-            
-        except Exception as e:
+        except _TRANSLATION_ERRORS as e:
             _LOGGER.warning("Fehler beim Laden der Geräte-Kategorien-Übersetzungen: %s", e)
             return {}
+
+        # Korrekte Struktur: entity.device_categories
+        entity_translations = translations.get("entity", {})
+        device_categories = entity_translations.get("device_categories", {})
+
+        _LOGGER.debug(
+            "%d Geräte-Kategorien aus Übersetzungen geladen", len(device_categories)
+        )
+        return MappingProxyType(device_categories)
     
-    async def get_ui_text(self) -> Dict[str, str]:
+    async def get_ui_text(self) -> Mapping[str, str]:
         """Gibt die UI-Texte zurück."""
         try:
-            translations = await async_get_translations(
-                self.hass, self.hass.config.language, "config", [DOMAIN]
+            translations = await self._async_get_translations(
+                self.hass.config.language, "config"
             )
-            
-            # UI-Texte aus den Übersetzungen extrahieren
-            ui_text = translations.get("ui_text", {})
-            
-            _LOGGER.debug("UI-Texte aus Übersetzungen geladen: %s", ui_text)
-            return ui_text
-            
-        except Exception as e:
+        except _TRANSLATION_ERRORS as e:
             _LOGGER.warning("Fehler beim Laden der UI-Texte: %s", e)
             return {}
+
+        # UI-Texte aus den Übersetzungen extrahieren
+        ui_text = translations.get("ui_text", {})
+
+        _LOGGER.debug("%d UI-Texte aus Übersetzungen geladen", len(ui_text))
+        return MappingProxyType(ui_text)
     
-    async def get_error_messages(self) -> Dict[str, str]:
+    async def get_error_messages(self) -> Mapping[str, str]:
         """Gibt die Fehlermeldungen zurück."""
         try:
-            translations = await async_get_translations(
-                self.hass, self.hass.config.language, "config", [DOMAIN]
+            translations = await self._async_get_translations(
+                self.hass.config.language, "config"
             )
-            
-            # Fehlermeldungen aus den Übersetzungen extrahieren
-            error_messages = translations.get("error_messages", {})
-            
-            _LOGGER.debug("Fehlermeldungen aus Übersetzungen geladen: %s", error_messages)
-            return error_messages
-            
-        except Exception as e:
+        except _TRANSLATION_ERRORS as e:
             _LOGGER.warning("Fehler beim Laden der Fehlermeldungen: %s", e)
             return {}
+
+        # Fehlermeldungen aus den Übersetzungen extrahieren
+        error_messages = translations.get("error_messages", {})
+
+        _LOGGER.debug(
+            "%d Fehlermeldungen aus Übersetzungen geladen", len(error_messages)
+        )
+        return MappingProxyType(error_messages)
     
-    async def get_state_text(self) -> Dict[str, str]:
+    async def get_state_text(self) -> Mapping[str, str]:
         """Gibt die Zustands-Texte zurück."""
         try:
-            translations = await async_get_translations(
-                self.hass, self.hass.config.language, "state", [DOMAIN]
+            return await self._async_get_translations(
+                self.hass.config.language, "state"
             )
-            return translations
-        except Exception as e:
+        except _TRANSLATION_ERRORS as e:
             _LOGGER.warning("Fehler beim Laden der Zustands-Texte: %s", e)
             return {}
     
-    def format_field_name(self, field_name: str, sensor_names: Optional[Dict[str, str]] = None) -> str:
+    def format_field_name(self, field_name: str, sensor_names: Optional[Mapping[str, str]] = None) -> str:
         """Gibt den übersetzten Namen des Sensors zurück."""
-        if sensor_names and field_name in sensor_names:
-            return sensor_names[field_name]
-        
         # Fallback: Verwende den ursprünglichen Feldnamen
-        return field_name
+        return (sensor_names or _EMPTY_TRANSLATIONS).get(field_name, field_name)
     
-    def format_device_category(self, category: str, device_categories: Optional[Dict[str, str]] = None) -> str:
+    def format_device_category(self, category: str, device_categories: Optional[Mapping[str, str]] = None) -> str:
         """Gibt den übersetzten Namen der Gerätekategorie zurück."""
-        if device_categories and category in device_categories:
-            return device_categories[category]
-        
         # Fallback: Verwende den ursprünglichen Kategorienamen
-        return category
+        return (device_categories or _EMPTY_TRANSLATIONS).get(category, category)
     
     async def debug_translations(self) -> Dict[str, Any]:
         """Debug-Methode um alle verfügbaren Übersetzungen zu überprüfen."""
+        # Entity-, Config- und State-Übersetzungen gleichzeitig laden
+        language = self.hass.config.language
         try:
-            debug_info = {}
-            
-            # Entity-Übersetzungen laden
-            entity_translations = await async_get_translations(
-                self.hass, self.hass.config.language, "entity", [DOMAIN]
-            )
-            debug_info["entity_translations"] = entity_translations
-            
-            # Config-Übersetzungen laden
-            config_translations = await async_get_translations(
-                self.hass, self.hass.config.language, "config", [DOMAIN]
+            (
+                entity_translations,
+                config_translations,
+                state_translations,
+            ) = await asyncio.gather(
+                *(
+                    self._async_get_translations(language, category)
+                    for category in _TRANSLATION_CATEGORIES
+                )
             )
-            debug_info["config_translations"] = config_translations
-            
-            # State-Übersetzungen laden
-            state_translations = await async_get_translations(
-                self.hass, self.hass.config.language, "state", [DOMAIN]
-            )
-            debug_info["state_translations"] = state_translations
-            
-            # Spezifische Sensor-Namen extrahieren
-            sensor_names = entity_translations.get("sensor_names", {})
-            debug_info["sensor_names"] = sensor_names
-            
-            _LOGGER.info("Translation Debug Info: %s", debug_info)
-            return debug_info
-            
-        except Exception as e:
+        except _TRANSLATION_ERRORS as e:
             _LOGGER.error("Fehler beim Debug der Übersetzungen: %s", e)
-            return {"error": str(e)} 
\ No newline at end of file
+            return {"error": str(e)}
+
+        debug_info = {
+            "entity_translations": entity_translations,
+            "config_translations": config_translations,
+            "state_translations": state_translations,
+            # Spezifische Sensor-Namen extrahieren
+            "sensor_names": entity_translations.get("sensor_names", {}),
+        }
+
+        _LOGGER.debug("Translation Debug Info: %s", list(debug_info))
+        return debug_info
@@ -1,10 +1,12 @@
 """Pytest configuration for SmartCity SensorBridge Partheland."""
 import sys
 from pathlib import Path
+from unittest.mock import AsyncMock, patch
 
 # Add the project root to the Python path so custom_components can be imported
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 import pytest
 
@@ -25,3 +27,18 @@ def auto_enable_custom_integrations(enable_custom_integrations):
     """
     yield
 
+
+@pytest.fixture
+def mock_setup_entry():
+    """Short-circuit entry setup and unload so flow tests skip the runtime.
+
+    Not autouse: the lifecycle tests exercise the real entry setup.
+    """
+    with patch(
+        "custom_components.sensorbridge_partheland.async_setup_entry",
+        AsyncMock(return_value=True),
+    ) as mock_setup, patch(
+        "custom_components.sensorbridge_partheland.async_unload_entry",
+        AsyncMock(return_value=True),
+    ):
+        yield mock_setup
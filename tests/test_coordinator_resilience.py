@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import socket
 import threading
 from contextlib import suppress
 from unittest.mock import AsyncMock, Mock, call, patch
@@ -458,6 +459,18 @@ def test_unhashable_paho_disconnect_reason_is_handled(hass):
     assert service.is_connected is False
 
 
+def test_mqtt_socket_disables_nagle_behind_websocket_wrapper(hass):
+    service = MQTTService(hass, Mock(), "entry-a")
+    raw_socket = Mock()
+    wrapper = Mock(spec=["_socket"], _socket=raw_socket)
+
+    service._on_socket_open(Mock(), None, wrapper)
+
+    raw_socket.setsockopt.assert_called_once_with(
+        socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+    )
+
+
 async def test_mqtt_event_processor_stops_cleanly(hass):
     service = MQTTService(hass, Mock(), "entry-a")
 
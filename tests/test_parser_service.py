@@ -3,6 +3,9 @@ from __future__ import annotations
 import json
 from unittest.mock import AsyncMock, Mock
 
+import pytest
+from homeassistant.util.json import json_loads
+
 from custom_components.sensorbridge_partheland.parser_service import ParserService
 
 
@@ -31,6 +34,11 @@ def _config_service(device_type: str, sensors: list[str]):
     service.get_canonical_sensor_name = AsyncMock(
         side_effect=lambda field: aliases.get(field, field)
     )
+    service.get_legacy_sensor_names = AsyncMock(
+        side_effect=lambda sensor: [
+            raw for raw, canonical in aliases.items() if canonical == sensor
+        ]
+    )
     service.load_config = AsyncMock(
         return_value={"field_mapping": {"unit_conversions": {}}}
     )
@@ -49,7 +57,7 @@ async def test_sensebox_raw_fields_are_mapped_to_api_names(hass):
         '{"fields":{"Temperatur":21.5,"GehaeuseTemp":22.0,"ignored":4}}',
     )
 
-    assert parsed["sensor_data"] == {
+    assert parsed.sensor_data == {
         "temperature": 21.5,
         "temperature_case": 22.0,
     }
@@ -65,7 +73,7 @@ async def test_specialized_raw_fields_are_mapped_to_api_names(hass):
         "sensoren/station", '{"fields":{"TempC_DS":12.4,"rssi":-90}}'
     )
 
-    assert parsed["sensor_data"] == {"soil_temperature": 12.4}
+    assert parsed.sensor_data == {"soil_temperature": 12.4}
 
 
 async def test_parse_message_parses_json_exactly_once(hass, mocker):
@@ -74,8 +82,8 @@ async def test_parse_message_parses_json_exactly_once(hass, mocker):
         _config_service("senseBox", ["temperature"]),
     )
     loads = mocker.patch(
-        "custom_components.sensorbridge_partheland.parser_service.json.loads",
-        wraps=json.loads,
+        "custom_components.sensorbridge_partheland.parser_service.json_loads",
+        wraps=json_loads,
     )
 
     parsed = await parser.parse_message(
@@ -83,5 +91,66 @@ async def test_parse_message_parses_json_exactly_once(hass, mocker):
         b'{"fields":{"Temperatur":21.5}}',
     )
 
-    assert parsed["sensor_data"] == {"temperature": 21.5}
+    assert parsed.sensor_data == {"temperature": 21.5}
     loads.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("topic", "valid"),
+    [
+        ("senseBox:home/station", True),
+        ("senseBox:home/median/Naunhof", True),
+        ("sensoren/station", True),
+        ("senseBox:home/", False),
+        ("senseBox:home/median/", False),
+        ("senseBox:home/median/Naunhof/extra", False),
+        ("sensoren/", False),
+        ("sensoren/station/extra", False),
+        ("other/station", False),
+    ],
+)
+def test_topic_validation(hass, topic, valid):
+    parser = ParserService(hass, _config_service("senseBox", []))
+
+    assert parser._is_valid_topic(topic) is valid
+
+
+async def test_configured_sensors_are_looked_up_once_per_device(hass):
+    config_service = _config_service("senseBox", ["temperature"])
+    parser = ParserService(hass, config_service)
+
+    for value in (21.5, 22.0):
+        parsed = await parser.parse_message(
+            "senseBox:home/station",
+            json.dumps({"fields": {"Temperatur": value}}),
+        )
+        assert parsed.sensor_data == {"temperature": value}
+
+    config_service.get_device_by_id.assert_awaited_once_with("station")
+    config_service.load_config.assert_awaited_once()
+    config_service.get_legacy_sensor_names.assert_awaited_once_with("temperature")
+
+
+async def test_median_sensors_are_resolved_by_location(hass):
+    config_service = _config_service("senseBox", [])
+    config_service.get_median_entities = AsyncMock(
+        return_value=[
+            {
+                "id": "median_Naunhof",
+                "location": "Naunhof",
+                "topic_pattern": "senseBox:home/median/Naunhof",
+                "sensors": ["Temperatur"],
+            }
+        ]
+    )
+    parser = ParserService(hass, config_service)
+
+    for _ in range(2):
+        parsed = await parser.parse_message(
+            "senseBox:home/median/Naunhof", '{"Temperatur":18.2,"PM10":3}'
+        )
+
+    assert parsed.device_id == "median_Naunhof"
+    assert parsed.sensor_data == {"Temperatur": 18.2}
+    assert parsed.is_median is True
+    config_service.get_median_entities.assert_awaited_once()
@@ -11,6 +11,7 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from custom_components.sensorbridge_partheland.const import DOMAIN
 from custom_components.sensorbridge_partheland.sensor import (
     SensorBridgeSensor,
+    _async_load_attribute_mappings,
     _resolve_sensor_unique_id,
 )
 
@@ -34,10 +35,11 @@ def _sensor_dependencies(hass):
     )
     config_service.get_icons = AsyncMock(return_value={})
     config_service.get_sensor_categories = AsyncMock(return_value={})
+    config_service.get_device_class_mapping = AsyncMock(return_value={})
     return coordinator, config_service
 
 
-def _temperature_sensor(coordinator, config_service):
+def _temperature_sensor(coordinator, config_service, attribute_mappings=None):
     return SensorBridgeSensor(
         coordinator,
         {
@@ -46,6 +48,7 @@ def _temperature_sensor(coordinator, config_service):
             "sensor_type": "temperature",
         },
         config_service,
+        attribute_mappings,
     )
 
 
@@ -115,6 +118,49 @@ def test_sensor_leaves_entity_id_assignment_to_registry(hass):
     assert sensor.suggested_object_id == "temperature"
 
 
+async def test_shared_attribute_mappings_are_loaded_once(hass):
+    coordinator, config_service = _sensor_dependencies(hass)
+    attribute_mappings = await _async_load_attribute_mappings(config_service)
+    sensors = [
+        _temperature_sensor(coordinator, config_service, attribute_mappings)
+        for _ in range(2)
+    ]
+
+    for sensor in sensors:
+        sensor.async_write_ha_state = Mock()
+        await sensor._load_sensor_attributes()
+
+    config_service.get_field_mapping.assert_awaited_once()
+    config_service.get_sensor_names.assert_awaited_once()
+    assert [sensor._attr_name for sensor in sensors] == [
+        "Temperatur",
+        "Temperatur",
+    ]
+
+
+async def test_sensor_icon_uses_first_matching_category(hass):
+    coordinator, config_service = _sensor_dependencies(hass)
+    config_service.get_icons = AsyncMock(
+        return_value={"climate": "mdi:thermometer", "other": "mdi:help"}
+    )
+    config_service.get_sensor_categories = AsyncMock(
+        return_value={
+            "climate": ["temperature", "humidity"],
+            "other": ["temperature"],
+        }
+    )
+    sensor = _temperature_sensor(
+        coordinator,
+        config_service,
+        await _async_load_attribute_mappings(config_service),
+    )
+    sensor.async_write_ha_state = Mock()
+
+    await sensor._load_sensor_attributes()
+
+    assert sensor._attr_icon == "mdi:thermometer"
+
+
 async def test_reload_preserves_registry_identity_without_suffix_drift(hass):
     entry = MockConfigEntry(domain=DOMAIN, data={})
     entry.add_to_hass(hass)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -28,8 +29,12 @@ def _entry(hass):
         },
     )
     entry.add_to_hass(hass)
+    config_service = Mock()
+    config_service.get_median_entities = AsyncMock(
+        return_value=[{"id": "median-a"}]
+    )
     entry.runtime_data = SensorBridgeRuntimeData(
-        config_service=Mock(),
+        config_service=config_service,
         coordinator=Mock(),
         supplemental_coordinators={
             DWD_POLLEN_SOURCE: Mock(),
@@ -75,7 +80,6 @@ async def test_one_entity_group_failure_does_not_drop_other_groups(
     median_factory = mocker.patch.object(
         sensor_platform,
         "create_median_entities",
-        new_callable=AsyncMock,
         return_value=[entities["median"]],
     )
     pollen_factory = mocker.patch(
@@ -150,7 +154,6 @@ async def test_async_add_entities_failure_propagates(hass, mocker):
     mocker.patch.object(
         sensor_platform,
         "create_median_entities",
-        new_callable=AsyncMock,
         return_value=[],
     )
     mocker.patch(
@@ -172,3 +175,111 @@ async def test_async_add_entities_failure_propagates(hass, mocker):
 
     with pytest.raises(RuntimeError, match="platform failed"):
         await sensor_platform.async_setup_entry(hass, entry, add_entities)
+
+
+async def test_median_config_is_loaded_once_for_all_medians(hass, mocker):
+    entry = _entry(hass)
+    entry.runtime_data.supplemental_coordinators.clear()
+    hass.config_entries.async_update_entry(
+        entry,
+        data={
+            CONF_SELECTED_DEVICES: [],
+            CONF_SELECTED_MEDIAN_ENTITIES: ["median-a", "median-b"],
+        },
+    )
+    medians = [{"id": "median-a"}, {"id": "median-b"}]
+    config_service = entry.runtime_data.config_service
+    config_service.get_median_entities = AsyncMock(return_value=medians)
+    mocker.patch.object(
+        sensor_platform,
+        "_async_load_attribute_mappings",
+        new_callable=AsyncMock,
+        return_value=None,
+    )
+    median_factory = mocker.patch.object(
+        sensor_platform, "create_median_entities", return_value=[]
+    )
+
+    await sensor_platform.async_setup_entry(hass, entry, Mock())
+
+    config_service.get_median_entities.assert_awaited_once()
+    assert [call.args[2] for call in median_factory.call_args_list] == medians
+
+
+async def test_unknown_medians_are_skipped_before_entity_creation(
+    hass, mocker
+):
+    entry = _entry(hass)
+    entry.runtime_data.supplemental_coordinators.clear()
+    hass.config_entries.async_update_entry(
+        entry,
+        data={
+            CONF_SELECTED_DEVICES: [],
+            CONF_SELECTED_MEDIAN_ENTITIES: ["median-a", "median-gone"],
+        },
+    )
+    mocker.patch.object(
+        sensor_platform,
+        "_async_load_attribute_mappings",
+        new_callable=AsyncMock,
+        return_value=None,
+    )
+    median_factory = mocker.patch.object(
+        sensor_platform, "create_median_entities", return_value=[]
+    )
+
+    await sensor_platform.async_setup_entry(hass, entry, Mock())
+
+    assert [call.args[1] for call in median_factory.call_args_list] == [
+        "median-a"
+    ]
+
+
+def _attribute_config_service(**overrides):
+    config_service = Mock()
+    config_service.get_field_mapping = AsyncMock(
+        return_value={"units": {"temperature": "°C"}}
+    )
+    config_service.get_sensor_names = AsyncMock(
+        return_value={"temperature": "Temperatur"}
+    )
+    config_service.get_icons = AsyncMock(return_value={"default": "mdi:gauge"})
+    config_service.get_sensor_categories = AsyncMock(
+        return_value={"climate": ["temperature"]}
+    )
+    config_service.get_device_class_mapping = AsyncMock(return_value={})
+    for name, side_effect in overrides.items():
+        getattr(config_service, name).side_effect = side_effect
+    return config_service
+
+
+async def test_optional_attribute_mappings_fall_back_individually():
+    config_service = _attribute_config_service(
+        get_icons=RuntimeError("icons"),
+        get_sensor_categories=RuntimeError("categories"),
+        get_device_class_mapping=RuntimeError("device classes"),
+    )
+
+    mappings = await sensor_platform._async_load_attribute_mappings(config_service)
+
+    assert mappings.field_mapping == {"units": {"temperature": "°C"}}
+    assert mappings.sensor_names == {"temperature": "Temperatur"}
+    assert mappings.icons == {}
+    assert mappings.sensor_category_index == {}
+    assert mappings.device_class_mapping == {}
+
+
+@pytest.mark.parametrize(
+    ("overrides", "expected"),
+    [
+        ({"get_field_mapping": RuntimeError("field mapping")}, RuntimeError),
+        ({"get_icons": asyncio.CancelledError()}, asyncio.CancelledError),
+    ],
+)
+async def test_field_mapping_failure_and_cancellation_propagate(
+    overrides, expected
+):
+    config_service = _attribute_config_service(**overrides)
+
+    with pytest.raises(expected):
+        await sensor_platform._async_load_attribute_mappings(config_service)
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import asyncio
+
+from custom_components.sensorbridge_partheland.translation_helper import (
+    TranslationHelper,
+)
+
+_MODULE = "custom_components.sensorbridge_partheland.translation_helper"
+
+
+async def test_translations_are_fetched_once_per_language_and_category(
+    hass, mocker
+):
+    fetch = mocker.patch(
+        f"{_MODULE}.async_get_translations",
+        new_callable=mocker.AsyncMock,
+        return_value={
+            "component.sensorbridge_partheland.entity.sensor.temperature.name": (
+                "Temperatur"
+            )
+        },
+    )
+    helper = TranslationHelper(hass)
+
+    first, second = await asyncio.gather(
+        helper.get_sensor_names(), helper.get_sensor_names()
+    )
+    await helper.get_device_categories()
+
+    assert first == second == {"temperature": "Temperatur"}
+    fetch.assert_awaited_once_with(
+        hass, hass.config.language, "entity", ["sensorbridge_partheland"]
+    )
+
+    hass.config.language = "en"
+    await helper.get_sensor_names()
+
+    assert fetch.await_count == 2